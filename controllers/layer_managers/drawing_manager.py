@@ -35,6 +35,19 @@ from qgis.PyQt.QtGui import QColor
 
 from .base_manager import BaseLayerManager
 
+# Number of segments for smooth range ring circles
+RANGE_RING_SEGMENTS = 64
+
+# (sin, cos) of each range ring vertex bearing. The same for every ring, so
+# computed once at import instead of per vertex of every ring.
+_RANGE_RING_BEARINGS = tuple(
+    (math.sin(bearing_rad), math.cos(bearing_rad))
+    for bearing_rad in (
+        math.radians((360.0 * i) / RANGE_RING_SEGMENTS)
+        for i in range(RANGE_RING_SEGMENTS + 1)
+    )
+)
+
 
 class DrawingLayerManager(BaseLayerManager):
     """
@@ -136,10 +149,8 @@ class DrawingLayerManager(BaseLayerManager):
         )
         distance_calc.setEllipsoid('WGS84')
 
-        total_distance = 0
-        for i in range(len(points_wgs84) - 1):
-            dist = distance_calc.measureLine(points_wgs84[i], points_wgs84[i + 1])
-            total_distance += dist
+        # Whole polyline in one call (segments summed in C++)
+        total_distance = distance_calc.measureLine(points_wgs84)
 
         logger.debug(f"Line '{name}': {len(points_wgs84)} points, total distance={total_distance:.2f}m")
 
@@ -388,14 +399,105 @@ class DrawingLayerManager(BaseLayerManager):
             int: Feature ID of added ring
         """
         layer = self._get_or_create_range_rings_layer()
+        feature = self._build_range_ring_feature(
+            layer, name, center_wgs84, radius_m, label, color,
+            lpb_category, percentile
+        )
+
+        # Add to layer with proper resource cleanup
+        layer.startEditing()
+        try:
+            layer.addFeature(feature)
+            if not layer.commitChanges():
+                errors = layer.commitErrors()
+                raise RuntimeError(f"Failed to commit range ring feature: {', '.join(errors)}")
+        except Exception as e:
+            layer.rollBack()
+            self.iface.messageBar().pushCritical(
+                "Range Ring Creation Error",
+                f"Failed to add range ring '{name}': {str(e)}"
+            )
+            raise
+        finally:
+            # Ensure layer is not left in edit mode
+            if layer.isEditable():
+                layer.rollBack()
 
+        layer.triggerRepaint()
+        return feature.id()
+
+    def add_range_rings(self, center_wgs84: QgsPointXY, rings: List[dict]) -> List[int]:
+        """
+        Add several range rings around one center in a single edit session.
+
+        All features are written to the (memory) provider with one
+        addFeatures call and repainted once, instead of one edit session,
+        commit and repaint per ring. The provider call returns the features
+        with their assigned IDs.
+
+        Args:
+            center_wgs84: Center point in WGS84
+            rings: List of dicts with keys name, radius_m and optionally
+                label, color, lpb_category, percentile (as for add_range_ring)
+
+        Returns:
+            List[int]: Feature IDs of added rings, in input order
+        """
+        layer = self._get_or_create_range_rings_layer()
+        features = [
+            self._build_range_ring_feature(
+                layer, ring['name'], center_wgs84, ring['radius_m'],
+                ring.get('label', ""), ring.get('color', "#FFA500"),
+                ring.get('lpb_category', ""), ring.get('percentile', 0)
+            )
+            for ring in rings
+        ]
+
+        # Add through the provider: unlike QgsVectorLayer.addFeatures, it
+        # hands back the added features with their IDs assigned
+        try:
+            ok, added = layer.dataProvider().addFeatures(features)
+            if not ok:
+                errors = layer.dataProvider().errors()
+                raise RuntimeError(f"Failed to add range ring features: {', '.join(errors)}")
+        except Exception as e:
+            self.iface.messageBar().pushCritical(
+                "Range Ring Creation Error",
+                f"Failed to add {len(features)} range rings: {str(e)}"
+            )
+            raise
+
+        layer.updateExtents()
+        layer.triggerRepaint()
+        return [feature.id() for feature in added]
+
+    def _build_range_ring_feature(self, layer, name: str, center_wgs84: QgsPointXY,
+                                  radius_m: float, label: str, color: str,
+                                  lpb_category: str, percentile: int) -> QgsFeature:
+        """
+        Build a range ring (circle) feature without adding it to the layer.
+
+        CRITICAL: Uses WGS84 ellipsoid geodesic calculations for accuracy.
+        DO NOT MODIFY the geodesic math without thorough testing.
+
+        Args:
+            layer: Range rings layer (provides the fields)
+            name: Ring name
+            center_wgs84: Center point in WGS84
+            radius_m: Radius in meters
+            label: Display label
+            color: Hex color string
+            lpb_category: LPB category if this is an LPB-based ring
+            percentile: LPB percentile if applicable
+
+        Returns:
+            QgsFeature: Ring feature with geometry and attributes set
+        """
         # Create circle geometry using geodesic calculations
         # Use proper WGS84 ellipsoid parameters for accuracy
         # CRITICAL: This code was carefully tuned for <1m accuracy
         # Bug fix from Day 7 audit - DO NOT MODIFY
 
-        # Number of segments for smooth circle
-        segments = 64
         points = []
 
         # WGS84 ellipsoid parameters (more accurate than sphere)
@@ -426,28 +528,28 @@ class DrawingLayerManager(BaseLayerManager):
             earth_radius = math.sqrt(numerator / denominator)
             logger.debug(f"Range ring: lat={center_wgs84.y():.6f}, radius_m={radius_m:.2f}, earth_radius={earth_radius:.2f}m")
 
-        # Create circle points using geodesic calculations
-        for i in range(segments + 1):
-            # Calculate bearing in degrees
-            bearing = (360.0 * i) / segments
+        # Loop invariants (same values, same evaluation order as per-vertex)
+        lon_rad = math.radians(center_wgs84.x())
 
-            # Convert to radians
-            bearing_rad = math.radians(bearing)
-            lon_rad = math.radians(center_wgs84.x())
-
-            # Calculate angular distance
-            angular_distance = radius_m / earth_radius
+        # Calculate angular distance
+        angular_distance = radius_m / earth_radius
+        sin_ad = math.sin(angular_distance)
+        cos_ad = math.cos(angular_distance)
+        sin_lat_cos_ad = sin_lat * cos_ad
+        cos_lat_sin_ad = cos_lat * sin_ad
 
+        # Create circle points using geodesic calculations
+        # (bearing sin/cos come from the precomputed table)
+        for sin_bearing, cos_bearing in _RANGE_RING_BEARINGS:
             # Calculate destination point using haversine formula
             # Clamp the argument to [-1, 1] to prevent domain errors from floating point rounding
-            sin_lat2 = (math.sin(lat_rad) * math.cos(angular_distance) +
-                       math.cos(lat_rad) * math.sin(angular_distance) * math.cos(bearing_rad))
+            sin_lat2 = sin_lat_cos_ad + cos_lat_sin_ad * cos_bearing
             sin_lat2 = max(-1.0, min(1.0, sin_lat2))  # Clamp to valid range
             lat2 = math.asin(sin_lat2)
 
             lon2 = lon_rad + math.atan2(
-                math.sin(bearing_rad) * math.sin(angular_distance) * math.cos(lat_rad),
-                math.cos(angular_distance) - math.sin(lat_rad) * math.sin(lat2)
+                sin_bearing * sin_ad * cos_lat,
+                cos_ad - sin_lat * sin_lat2
             )
 
             # Convert back to degrees
@@ -474,27 +576,7 @@ class DrawingLayerManager(BaseLayerManager):
             datetime.now().isoformat()
         ])
 
-        # Add to layer with proper resource cleanup
-        layer.startEditing()
-        try:
-            layer.addFeature(feature)
-            if not layer.commitChanges():
-                errors = layer.commitErrors()
-                raise RuntimeError(f"Failed to commit range ring feature: {', '.join(errors)}")
-        except Exception as e:
-            layer.rollBack()
-            self.iface.messageBar().pushCritical(
-                "Range Ring Creation Error",
-                f"Failed to add range ring '{name}': {str(e)}"
-            )
-            raise
-        finally:
-            # Ensure layer is not left in edit mode
-            if layer.isEditable():
-                layer.rollBack()
-
-        layer.triggerRepaint()
-        return feature.id()
+        return feature
 
     # =========================================================================
     # Bearing Lines Layer
@@ -275,6 +275,20 @@ class LayersController:
             lpb_category, percentile
         )
 
+    def add_range_rings(self, center_wgs84: QgsPointXY, rings: List[dict]) -> List[int]:
+        """
+        Add several range rings around one center in a single edit session.
+
+        Args:
+            center_wgs84: Center point in WGS84
+            rings: List of dicts with keys name, radius_m and optionally
+                label, color, lpb_category, percentile (as for add_range_ring)
+
+        Returns:
+            List[int]: Feature IDs of added rings, in input order
+        """
+        return self.drawings.add_range_rings(center_wgs84, rings)
+
     def add_bearing_line(self, name: str, origin_wgs84: QgsPointXY,
                          bearing: float, distance_m: float,
                          label: str = "", color: str = "#800080") -> int:
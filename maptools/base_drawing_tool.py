@@ -9,17 +9,53 @@ preview management, and tool lifecycle.
 Qt5/Qt6 Compatible: Uses qgis.PyQt and qt_compat for all Qt imports.
 """
 
+import math
+
 from qgis.core import (
-    QgsPointXY, QgsCoordinateReferenceSystem, QgsCoordinateTransform,
-    QgsProject, QgsDistanceArea
+    Qgis, QgsPointXY, QgsCoordinateReferenceSystem, QgsCoordinateTransform,
+    QgsProject, QgsDistanceArea, QgsGeometry, QgsCsException
 )
 from qgis.gui import QgsMapTool, QgsRubberBand
 from qgis.PyQt.QtCore import pyqtSignal
-from qgis.PyQt.QtGui import QCursor
+from qgis.PyQt.QtGui import QCursor, QColor
 
 # Import Qt5/Qt6 compatible constants
 from ..utils.qt_compat import CrossCursor, Key_Escape
 
+# Degree/radian conversion factors (multiply instead of calling math.radians/degrees)
+_RAD = math.pi / 180.0
+_DEG = 180.0 / math.pi
+
+# Successful QgsGeometry.transform() result (enum moved to Qgis in QGIS 3.22)
+try:
+    _GEOMETRY_OK = Qgis.GeometryOperationResult.Success
+except AttributeError:
+    _GEOMETRY_OK = QgsGeometry.Success
+
+# Preview rubber band style shared by the line-drawing tools
+PREVIEW_RB_COLOR = QColor(255, 0, 0, 180)  # Red, semi-transparent
+PREVIEW_RB_WIDTH = 2
+
+
+def wrap_360(angle):
+    """
+    Normalize an angle in degrees to [0, 360).
+
+    Uses conditional add/subtract rather than float modulo; valid for
+    inputs in [-360, 720), which covers atan2 output and +/- declination.
+
+    Args:
+        angle: Angle in degrees
+
+    Returns:
+        Angle in degrees in the range [0, 360)
+    """
+    if angle < 0.0:
+        angle += 360.0
+    if angle >= 360.0:  # Also catches tiny negatives that round up to 360
+        angle -= 360.0
+    return angle
+
 
 class BaseDrawingTool(QgsMapTool):
     """
@@ -69,6 +105,13 @@ class BaseDrawingTool(QgsMapTool):
         )
         self.distance_calc.setEllipsoid('WGS84')
 
+        # Canvas CRS resolved at activation (see _bind_canvas_transforms)
+        self._canvas_crs_authid = None
+        self._ct_to_wgs84 = None
+        self._ct_to_itm = None
+        self._ct_from_wgs84 = None
+        self._crs_signal_connected = False
+
         # Rubber bands for preview (subclasses can add more)
         self.rubber_bands = []
 
@@ -86,6 +129,11 @@ class BaseDrawingTool(QgsMapTool):
             QgsPointXY in WGS84, or original point if transformation fails
         """
         try:
+            if self._canvas_crs_authid is not None:
+                # Active: use the transform validated at activation
+                ct = self._ct_to_wgs84
+                return ct.transform(point) if ct else point
+
             canvas_crs = self.canvas.mapSettings().destinationCrs()
             if canvas_crs.authid() == "EPSG:4326":
                 return point
@@ -100,6 +148,86 @@ class BaseDrawingTool(QgsMapTool):
             print(f"Error transforming to WGS84: {e}")
             return point  # Return original point as fallback
 
+    def transform_points_to_wgs84(self, points):
+        """
+        Transform a list of points from canvas CRS to WGS84 in one call.
+
+        Args:
+            points: List of QgsPointXY in canvas CRS
+
+        Returns:
+            List of QgsPointXY in WGS84 (points that cannot be transformed
+            are returned unchanged, as with transform_to_wgs84)
+        """
+        if self._canvas_crs_authid is None:
+            # Tool not active - use the generic point transform
+            return [self.transform_to_wgs84(p) for p in points]
+
+        ct = self._ct_to_wgs84
+        if ct is None:
+            return list(points)  # WGS84 canvas or invalid transform
+
+        try:
+            geometry = QgsGeometry.fromMultiPointXY(points)
+            if geometry.transform(ct) == _GEOMETRY_OK:
+                return geometry.asMultiPoint()
+        except QgsCsException as e:
+            print(f"Error transforming to WGS84: {e}")
+
+        # Batch transform failed - fall back to per-point transforms
+        return [self.transform_to_wgs84(p) for p in points]
+
+    def _build_transform(self, source_crs, dest_crs):
+        """
+        Build a transform between two CRSs.
+
+        Returns:
+            QgsCoordinateTransform, or None if the CRSs match or the
+            transform is not valid (callers then pass points through)
+        """
+        if source_crs.authid() == dest_crs.authid():
+            return None
+
+        transform = QgsCoordinateTransform(source_crs, dest_crs, QgsProject.instance())
+        if not transform.isValid():
+            print(f"Invalid transform {source_crs.authid()} -> {dest_crs.authid()}")
+            return None
+        return transform
+
+    def _bind_canvas_transforms(self):
+        """
+        Resolve the canvas CRS and cache the transforms used while active.
+
+        Called on activation and whenever the canvas CRS or the project's
+        transform context (datum transformations) changes. Transforms
+        are built and validated once here, so per-point calls neither
+        re-check the CRS nor rebuild the transform.
+        """
+        canvas_crs = self.canvas.mapSettings().destinationCrs()
+        self._canvas_crs_authid = canvas_crs.authid()
+
+        self._ct_to_wgs84 = self._build_transform(canvas_crs, self.wgs84)
+        self._ct_to_itm = self._build_transform(canvas_crs, self.itm)
+        self._ct_from_wgs84 = self._build_transform(self.wgs84, canvas_crs)
+
+    def _unbind_canvas_transforms(self):
+        """Drop the cached transforms; the transform methods resolve the CRS per call again."""
+        if self._crs_signal_connected:
+            try:
+                self.canvas.destinationCrsChanged.disconnect(self._bind_canvas_transforms)
+            except (TypeError, RuntimeError):
+                pass  # Already disconnected or canvas deleted
+            try:
+                QgsProject.instance().transformContextChanged.disconnect(self._bind_canvas_transforms)
+            except (TypeError, RuntimeError):
+                pass  # Already disconnected
+            self._crs_signal_connected = False
+
+        self._canvas_crs_authid = None
+        self._ct_to_wgs84 = None
+        self._ct_to_itm = None
+        self._ct_from_wgs84 = None
+
     def transform_to_itm(self, point):
         """
         Transform point from canvas CRS to Irish Grid (ITM).
@@ -111,6 +239,11 @@ class BaseDrawingTool(QgsMapTool):
             QgsPointXY in ITM, or original point if transformation fails
         """
         try:
+            if self._canvas_crs_authid is not None:
+                # Active: use the transform validated at activation
+                ct = self._ct_to_itm
+                return ct.transform(point) if ct else point
+
             canvas_crs = self.canvas.mapSettings().destinationCrs()
             if canvas_crs.authid() == "EPSG:29903":
                 return point
@@ -136,6 +269,11 @@ class BaseDrawingTool(QgsMapTool):
             QgsPointXY in canvas CRS, or original point if transformation fails
         """
         try:
+            if self._canvas_crs_authid is not None:
+                # Active: use the transform validated at activation
+                ct = self._ct_from_wgs84
+                return ct.transform(point) if ct else point
+
             canvas_crs = self.canvas.mapSettings().destinationCrs()
             if canvas_crs.authid() == "EPSG:4326":
                 return point
@@ -174,29 +312,23 @@ class BaseDrawingTool(QgsMapTool):
         Returns:
             Bearing in degrees (0-360, where 0 = North), or 0.0 if points are identical
         """
-        import math
-
         # Handle identical points
         if (abs(point1_wgs84.x() - point2_wgs84.x()) < 1e-9 and
             abs(point1_wgs84.y() - point2_wgs84.y()) < 1e-9):
             return 0.0
 
-        lat1 = math.radians(point1_wgs84.y())
-        lat2 = math.radians(point2_wgs84.y())
-        lon1 = math.radians(point1_wgs84.x())
-        lon2 = math.radians(point2_wgs84.x())
-
-        dlon = lon2 - lon1
+        lat1 = point1_wgs84.y() * _RAD
+        lat2 = point2_wgs84.y() * _RAD
+        dlon = (point2_wgs84.x() - point1_wgs84.x()) * _RAD
 
         x = math.sin(dlon) * math.cos(lat2)
         y = (math.cos(lat1) * math.sin(lat2) -
              math.sin(lat1) * math.cos(lat2) * math.cos(dlon))
 
-        bearing = math.atan2(x, y)
-        bearing = math.degrees(bearing)
+        bearing = math.atan2(x, y) * _DEG
 
         # Normalize to 0-360
-        return (bearing + 360) % 360
+        return wrap_360(bearing)
 
     def clear_rubber_bands(self):
         """Clear all rubber band previews."""
@@ -223,11 +355,20 @@ class BaseDrawingTool(QgsMapTool):
         self.canvas.setCursor(QCursor(CrossCursor))
         self.clear_rubber_bands()
 
+        # Specialise transforms for the current canvas CRS
+        self._bind_canvas_transforms()
+        if not self._crs_signal_connected:
+            self.canvas.destinationCrsChanged.connect(self._bind_canvas_transforms)
+            # Cached transforms capture the project's transform context
+            QgsProject.instance().transformContextChanged.connect(self._bind_canvas_transforms)
+            self._crs_signal_connected = True
+
     def deactivate(self):
         """Called when tool is deactivated."""
         super().deactivate()
         self.is_active = False
         self.clear_rubber_bands()
+        self._unbind_canvas_transforms()
 
     def keyPressEvent(self, event):
         """
@@ -8,6 +8,9 @@ Used for witness sightings, radio direction finding, and line-of-sight analysis.
 Qt5/Qt6 Compatible: Uses qgis.PyQt and qt_compat for all Qt imports.
 """
 
+import logging
+from dataclasses import dataclass
+
 from qgis.core import QgsPointXY, QgsGeometry, QgsWkbTypes
 from qgis.gui import QgsRubberBand
 from qgis.PyQt.QtCore import Qt
@@ -21,7 +24,34 @@ from qgis.PyQt.QtWidgets import (
 # Import Qt5/Qt6 compatible constants and functions
 from ..utils.qt_compat import LeftButton, RightButton, Key_Escape, dialog_exec, push_message, DialogAccepted
 
-from .base_drawing_tool import BaseDrawingTool
+from .base_drawing_tool import BaseDrawingTool, wrap_360
+
+try:
+    from qgis.utils import iface
+except ImportError:
+    iface = None  # Running outside the QGIS application
+
+# Set up logger for this module
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class BearingData:
+    """Bearing line configuration collected by BearingLineDialog."""
+
+    __slots__ = (
+        'name', 'bearing', 'bearing_input', 'bearing_type',
+        'magnetic_bearing', 'distance_m', 'label', 'color'
+    )
+
+    name: str
+    bearing: float  # Always the true bearing
+    bearing_input: float  # What the user entered
+    bearing_type: str  # 'True' or 'Magnetic'
+    magnetic_bearing: float
+    distance_m: float
+    label: str
+    color: str  # Hex color
 
 
 class BearingLineDialog(QDialog):
@@ -39,6 +69,16 @@ class BearingLineDialog(QDialog):
     # Negative = West declination
     MAGNETIC_DECLINATION_IRELAND = -4.5
 
+    # Line colors offered in the dialog: (display name, hex color)
+    COLORS = (
+        ("Purple", "#800080"),
+        ("Red", "#FF0000"),
+        ("Blue", "#0000FF"),
+        ("Green", "#00AA00"),
+        ("Orange", "#FFA500"),
+        ("Yellow", "#FFD700"),
+    )
+
     def __init__(self, origin_lat, origin_lon, parent=None):
         """
         Initialize bearing line dialog.
@@ -70,9 +110,8 @@ class BearingLineDialog(QDialog):
         origin_group = QGroupBox("Origin Point")
         origin_layout = QFormLayout()
 
-        origin_text = f"{self.origin_lat:.6f}°, {self.origin_lon:.6f}°"
-        origin_label = QLabel(origin_text)
-        origin_layout.addRow("Coordinates:", origin_label)
+        self.origin_label = QLabel(self._format_origin())
+        origin_layout.addRow("Coordinates:", self.origin_label)
 
         origin_group.setLayout(origin_layout)
         layout.addWidget(origin_group)
@@ -160,12 +199,8 @@ class BearingLineDialog(QDialog):
         color_layout = QFormLayout()
 
         self.color_combo = QComboBox()
-        self.color_combo.addItem("Purple", "#800080")
-        self.color_combo.addItem("Red", "#FF0000")
-        self.color_combo.addItem("Blue", "#0000FF")
-        self.color_combo.addItem("Green", "#00AA00")
-        self.color_combo.addItem("Orange", "#FFA500")
-        self.color_combo.addItem("Yellow", "#FFD700")
+        for color_name, color_hex in self.COLORS:
+            self.color_combo.addItem(color_name, color_hex)
         color_layout.addRow("Color:", self.color_combo)
 
         color_group.setLayout(color_layout)
@@ -196,6 +231,40 @@ class BearingLineDialog(QDialog):
         # Focus on name input
         self.name_input.setFocus()
 
+    def _format_origin(self):
+        """Format origin coordinates for display."""
+        return f"{self.origin_lat:.6f}°, {self.origin_lon:.6f}°"
+
+    def reset(self, origin_lat, origin_lon):
+        """
+        Prepare the dialog for reuse with a new origin point.
+
+        Restores every field to its default so a previous bearing or
+        magnetic setting cannot carry over into the next line unnoticed.
+
+        Args:
+            origin_lat: Origin point latitude (WGS84)
+            origin_lon: Origin point longitude (WGS84)
+        """
+        self.origin_lat = origin_lat
+        self.origin_lon = origin_lon
+        self.origin_label.setText(self._format_origin())
+        self.name_input.clear()
+
+        self.true_bearing_radio.setChecked(True)
+        self.bearing_spin.setValue(0.0)
+        # Unit first: switching it adjusts the distance range
+        self.distance_unit_combo.setCurrentIndex(0)
+        self.distance_spin.setValue(1000.0)
+        self.color_combo.setCurrentIndex(0)
+
+        # Same label state as a freshly built dialog
+        self.declination_label.setVisible(False)
+        self.converted_bearing_label.setVisible(False)
+
+        self.name_input.setFocus()
+        self.bearing_data = None
+
     def _on_bearing_type_changed(self):
         """Handle bearing type radio button changes."""
         is_magnetic = self.magnetic_bearing_radio.isChecked()
@@ -209,10 +278,7 @@ class BearingLineDialog(QDialog):
             magnetic_bearing = self.bearing_spin.value()
             true_bearing = magnetic_bearing - self.MAGNETIC_DECLINATION_IRELAND
             # Normalize to 0-360
-            if true_bearing < 0:
-                true_bearing += 360
-            elif true_bearing >= 360:
-                true_bearing -= 360
+            true_bearing = wrap_360(true_bearing)
 
             self.converted_bearing_label.setText(f"→ True Bearing: {true_bearing:.1f}°")
             self.converted_bearing_label.setVisible(True)
@@ -221,10 +287,7 @@ class BearingLineDialog(QDialog):
             true_bearing = self.bearing_spin.value()
             magnetic_bearing = true_bearing + self.MAGNETIC_DECLINATION_IRELAND
             # Normalize to 0-360
-            if magnetic_bearing < 0:
-                magnetic_bearing += 360
-            elif magnetic_bearing >= 360:
-                magnetic_bearing -= 360
+            magnetic_bearing = wrap_360(magnetic_bearing)
 
             self.converted_bearing_label.setText(f"→ Magnetic Bearing: {magnetic_bearing:.1f}°")
             self.converted_bearing_label.setVisible(True)
@@ -256,20 +319,14 @@ class BearingLineDialog(QDialog):
         if self.magnetic_bearing_radio.isChecked():
             true_bearing = bearing_input - self.MAGNETIC_DECLINATION_IRELAND
             # Normalize to 0-360
-            if true_bearing < 0:
-                true_bearing += 360
-            elif true_bearing >= 360:
-                true_bearing -= 360
+            true_bearing = wrap_360(true_bearing)
             bearing_type = "Magnetic"
             magnetic_bearing = bearing_input
         else:
             true_bearing = bearing_input
             bearing_type = "True"
             magnetic_bearing = bearing_input + self.MAGNETIC_DECLINATION_IRELAND
-            if magnetic_bearing < 0:
-                magnetic_bearing += 360
-            elif magnetic_bearing >= 360:
-                magnetic_bearing -= 360
+            magnetic_bearing = wrap_360(magnetic_bearing)
 
         # Get distance in meters
         distance_value = self.distance_spin.value()
@@ -294,16 +351,16 @@ class BearingLineDialog(QDialog):
         label = f"{bearing_input:.1f}° ({bearing_type}), {distance_m:.0f}m"
 
         # Prepare result data
-        self.bearing_data = {
-            'name': name,
-            'bearing': true_bearing,  # Always store true bearing
-            'bearing_input': bearing_input,  # What user entered
-            'bearing_type': bearing_type,
-            'magnetic_bearing': magnetic_bearing,
-            'distance_m': distance_m,
-            'label': label,
-            'color': color
-        }
+        self.bearing_data = BearingData(
+            name=name,
+            bearing=true_bearing,  # Always store true bearing
+            bearing_input=bearing_input,  # What user entered
+            bearing_type=bearing_type,
+            magnetic_bearing=magnetic_bearing,
+            distance_m=distance_m,
+            label=label,
+            color=color
+        )
 
         self.accept()
 
@@ -315,6 +372,10 @@ class BearingTool(BaseDrawingTool):
     Click to set origin point, then configure bearing and distance in dialog.
     """
 
+    # Clicks arriving within this window of the last accepted click are ignored
+    # (accidental double-clicks would otherwise open a second modal dialog)
+    CLICK_DEDUP_MS = 150
+
     def __init__(self, canvas, layers_controller):
         """
         Initialize bearing line tool.
@@ -328,6 +389,13 @@ class BearingTool(BaseDrawingTool):
 
         # State
         self.origin_point = None  # Canvas CRS
+        self._last_click_ms = None  # Timestamp of last accepted click
+
+        # Dialog is built on first use and reused for later clicks
+        self._dialog = None
+
+        # Last origin transformed to WGS84: ((crs_authid, x, y), QgsPointXY)
+        self._wgs_cache = (None, None)
 
     def activate(self):
         """Called when tool is activated."""
@@ -347,6 +415,13 @@ class BearingTool(BaseDrawingTool):
             event: QgsMapMouseEvent
         """
         if event.button() == LeftButton:
+            # Ignore repeated clicks (e.g. double-click) within the dedup window
+            now = event.timestamp()
+            if (self._last_click_ms is not None and
+                    0 <= now - self._last_click_ms < self.CLICK_DEDUP_MS):
+                return
+            self._last_click_ms = now
+
             # Get click position
             self.origin_point = self.toMapCoordinates(event.pos())
 
@@ -356,11 +431,21 @@ class BearingTool(BaseDrawingTool):
     def _show_dialog(self):
         """Show bearing line configuration dialog."""
         try:
-            # Transform origin to WGS84 for display
-            origin_wgs84 = self.transform_to_wgs84(self.origin_point)
+            # Transform origin to WGS84 for display (reused on cancel/retry
+            # at the same spot)
+            key = (self._canvas_crs_authid, self.origin_point.x(), self.origin_point.y())
+            if self._wgs_cache[0] == key:
+                origin_wgs84 = self._wgs_cache[1]
+            else:
+                origin_wgs84 = self.transform_to_wgs84(self.origin_point)
+                self._wgs_cache = (key, origin_wgs84)
 
-            # Use None as parent since canvas is not a QWidget
-            dialog = BearingLineDialog(origin_wgs84.y(), origin_wgs84.x(), None)
+            if self._dialog is None:
+                # Use None as parent since canvas is not a QWidget
+                self._dialog = BearingLineDialog(origin_wgs84.y(), origin_wgs84.x(), None)
+            else:
+                self._dialog.reset(origin_wgs84.y(), origin_wgs84.x())
+            dialog = self._dialog
 
             if dialog_exec(dialog) == DialogAccepted and dialog.bearing_data:
                 self._create_bearing_line(origin_wgs84, dialog.bearing_data)
@@ -372,9 +457,7 @@ class BearingTool(BaseDrawingTool):
                 self.drawing_cancelled.emit()
 
         except Exception as e:
-            print(f"Error showing bearing dialog: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("Error showing bearing dialog: %s", e)
             self.origin_point = None
             if self.canvas:
                 self.canvas.unsetMapTool(self)
@@ -386,18 +469,18 @@ class BearingTool(BaseDrawingTool):
 
         Args:
             origin_wgs84: Origin point in WGS84
-            bearing_data: Dict with bearing line configuration
+            bearing_data: BearingData with bearing line configuration
         """
         success = False
         try:
             # Add to layer using DrawingManager
             feature_id = self.layers_controller.add_bearing_line(
-                name=bearing_data['name'],
+                name=bearing_data.name,
                 origin_wgs84=origin_wgs84,
-                bearing=bearing_data['bearing'],  # True bearing
-                distance_m=bearing_data['distance_m'],
-                label=bearing_data['label'],
-                color=bearing_data['color']
+                bearing=bearing_data.bearing,  # True bearing
+                distance_m=bearing_data.distance_m,
+                label=bearing_data.label,
+                color=bearing_data.color
             )
 
             success = True
@@ -406,22 +489,19 @@ class BearingTool(BaseDrawingTool):
             self.drawing_complete.emit({
                 'type': 'bearing_line',
                 'feature_id': feature_id,
-                'name': bearing_data['name'],
-                'bearing': bearing_data['bearing'],
-                'bearing_type': bearing_data['bearing_type'],
-                'magnetic_bearing': bearing_data['magnetic_bearing'],
-                'distance_m': bearing_data['distance_m'],
+                'name': bearing_data.name,
+                'bearing': bearing_data.bearing,
+                'bearing_type': bearing_data.bearing_type,
+                'magnetic_bearing': bearing_data.magnetic_bearing,
+                'distance_m': bearing_data.distance_m,
                 'origin_lat': origin_wgs84.y(),
                 'origin_lon': origin_wgs84.x()
             })
 
         except Exception as e:
-            print(f"Error creating bearing line: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("Error creating bearing line: %s", e)
             # Show error to user
             try:
-                from qgis.utils import iface
                 if iface:
                     push_message(
                         iface.messageBar(),
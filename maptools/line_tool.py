@@ -7,14 +7,23 @@ Interactive tool for drawing lines on the map (routes, boundaries, paths).
 Qt5/Qt6 Compatible: Uses qgis.PyQt and qt_compat for all Qt imports.
 """
 
-from qgis.core import QgsPointXY, QgsGeometry, QgsWkbTypes
+import logging
+
+from qgis.core import QgsGeometry, QgsWkbTypes
 from qgis.gui import QgsRubberBand
-from qgis.PyQt.QtGui import QColor
 
 # Import Qt5/Qt6 compatible constants and functions
 from ..utils.qt_compat import LeftButton, RightButton, Key_Escape, push_message
 
-from .base_drawing_tool import BaseDrawingTool
+from .base_drawing_tool import BaseDrawingTool, PREVIEW_RB_COLOR, PREVIEW_RB_WIDTH
+
+try:
+    from qgis.utils import iface
+except ImportError:
+    iface = None  # Running outside the QGIS application
+
+# Set up logger for this module
+logger = logging.getLogger(__name__)
 
 
 class LineTool(BaseDrawingTool):
@@ -25,6 +34,16 @@ class LineTool(BaseDrawingTool):
     Line is saved to Lines layer when complete.
     """
 
+    # Default Douglas-Peucker tolerance applied before saving (meters, 0 = off).
+    # Off by default: every vertex of a drawn line is a deliberate click.
+    SIMPLIFY_TOLERANCE_M = 0.0
+
+    # Approximate length of one degree of latitude (meters)
+    METERS_PER_DEGREE = 111320.0
+
+    # Clicks closer than this to the previous vertex are ignored (pixels)
+    DUPLICATE_CLICK_PX = 2.0
+
     def __init__(self, canvas, layers_controller):
         """
         Initialize line drawing tool.
@@ -36,9 +55,14 @@ class LineTool(BaseDrawingTool):
         super().__init__(canvas)
         self.layers_controller = layers_controller
 
+        # Simplification tolerance for saved lines (meters, 0 disables)
+        self.simplify_tolerance_m = self.SIMPLIFY_TOLERANCE_M
+
         # Line drawing state
         self.points = []  # Points in canvas CRS
         self.is_drawing = False
+        self._running_length_m = 0.0  # Length of committed segments
+        self._points_wgs84 = []  # Committed points in WGS84, parallel to self.points
 
         # Rubber band for preview
         self.line_rubber_band = None
@@ -57,6 +81,8 @@ class LineTool(BaseDrawingTool):
         """Reset drawing state."""
         self.points = []
         self.is_drawing = False
+        self._running_length_m = 0.0
+        self._points_wgs84 = []
         self.clear_rubber_bands()
         self.line_rubber_band = None  # Clear the rubber band reference
 
@@ -70,11 +96,29 @@ class LineTool(BaseDrawingTool):
         if event.button() == LeftButton:
             # Get click position
             point = self.toMapCoordinates(event.pos())
+
+            # Ignore clicks on (nearly) the same spot as the previous vertex,
+            # e.g. an accidental double-click, to avoid zero-length segments
+            if self.points:
+                last = self.points[-1]
+                eps = self.canvas.mapUnitsPerPixel() * self.DUPLICATE_CLICK_PX
+                dx = point.x() - last.x()
+                dy = point.y() - last.y()
+                if dx * dx + dy * dy < eps * eps:
+                    return
+
             self.points.append(point)
             self.is_drawing = True
 
+            # Transform once per click (guarded; falls back to the input
+            # point) and extend running length by the new segment
+            point_wgs84 = self.transform_to_wgs84(point)
+            if self._points_wgs84:
+                self._running_length_m += self.calculate_distance(self._points_wgs84[-1], point_wgs84)
+            self._points_wgs84.append(point_wgs84)
+
             # Update preview
-            self._update_rubber_band()
+            self._commit_point(point)
 
         elif event.button() == RightButton:
             # Right-click finishes the line
@@ -92,7 +136,7 @@ class LineTool(BaseDrawingTool):
             current_pos = self.toMapCoordinates(event.pos())
 
             # Update rubber band with preview
-            self._update_rubber_band(preview_point=current_pos)
+            self._update_preview(current_pos)
 
     def keyPressEvent(self, event):
         """
@@ -107,47 +151,65 @@ class LineTool(BaseDrawingTool):
             self.cancel()
         # Could add Key_Return to finish line if desired
 
-    def _update_rubber_band(self, preview_point=None):
+    def _ensure_rubber_band(self):
         """
-        Update rubber band preview.
+        Create the preview rubber band if needed.
 
-        Args:
-            preview_point: Optional preview point (cursor position)
+        Returns:
+            bool: False if the canvas is not available
         """
         # Check canvas is valid
         if not self.canvas or not self.canvas.scene():
-            return
+            return False
 
-        # Always create a fresh rubber band if we don't have a valid one
         if not self.line_rubber_band:
-            # Remove old rubber band if it exists
-            if self.line_rubber_band:
-                try:
-                    self.canvas.scene().removeItem(self.line_rubber_band)
-                except Exception:
-                    pass
-
-            # Create new rubber band
             self.line_rubber_band = QgsRubberBand(
                 self.canvas,
                 QgsWkbTypes.LineGeometry
             )
-            self.line_rubber_band.setColor(QColor(255, 0, 0, 180))  # Red
-            self.line_rubber_band.setWidth(2)
+            self.line_rubber_band.setColor(PREVIEW_RB_COLOR)
+            self.line_rubber_band.setWidth(PREVIEW_RB_WIDTH)
+            self.line_rubber_band.show()  # Stays visible until cleared
             self.rubber_bands.append(self.line_rubber_band)
 
-        # Build preview line
-        preview_points = list(self.points)
-        if preview_point:
-            preview_points.append(preview_point)
+        return True
+
+    def _commit_point(self, point):
+        """
+        Add a clicked vertex to the rubber band preview.
+
+        The rubber band holds the committed vertices plus one trailing preview
+        vertex, so mouse moves only need to move that last vertex.
+
+        Args:
+            point: Newly added point (already appended to self.points)
+        """
+        if not self._ensure_rubber_band():
+            return
+
+        band = self.line_rubber_band
+        if band.numberOfVertices() == len(self.points):
+            # Pin the trailing preview vertex at the clicked position and
+            # add a new trailing preview vertex
+            band.movePoint(len(self.points) - 1, point)
+            band.addPoint(point)
+        else:
+            # First point (or band recreated) - set committed vertices plus
+            # the trailing preview vertex in one geometry update
+            band.setToGeometry(
+                QgsGeometry.fromPolylineXY(self.points + [point]),
+                None
+            )
 
-        # Update rubber band - reset and rebuild
-        self.line_rubber_band.reset(QgsWkbTypes.LineGeometry)
-        for point in preview_points:
-            self.line_rubber_band.addPoint(point)
+    def _update_preview(self, preview_point):
+        """
+        Move the trailing preview vertex to the cursor.
 
-        # Force update
-        self.line_rubber_band.show()
+        Args:
+            preview_point: Cursor position in canvas CRS
+        """
+        if self.line_rubber_band:
+            self.line_rubber_band.movePoint(len(self.points), preview_point)
 
     def _finish_line(self):
         """Finish drawing and save line to layer."""
@@ -157,14 +219,18 @@ class LineTool(BaseDrawingTool):
             return
 
         try:
-            # Transform points to WGS84 for storage
-            points_wgs84 = [self.transform_to_wgs84(p) for p in self.points]
-
-            # Calculate total distance
-            total_distance = 0
-            for i in range(len(points_wgs84) - 1):
-                dist = self.calculate_distance(points_wgs84[i], points_wgs84[i + 1])
-                total_distance += dist
+            # Points were transformed to WGS84 as they were clicked
+            points_wgs84 = self._points_wgs84
+
+            # Drop near-collinear vertices before saving (if enabled)
+            simplified = self._simplify(points_wgs84, self.simplify_tolerance_m)
+            if simplified is points_wgs84:
+                # Total distance was accumulated segment by segment as points were added
+                total_distance = self._running_length_m
+            else:
+                # Measure the line that is actually saved
+                points_wgs84 = simplified
+                total_distance = self.distance_calc.measureLine(points_wgs84)
 
             # Create line name with distance
             name = f"Line {total_distance:.0f}m"
@@ -188,12 +254,9 @@ class LineTool(BaseDrawingTool):
             })
 
         except Exception as e:
-            print(f"Error saving line: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("Error saving line: %s", e)
             # Show error to user via iface if available
             try:
-                from qgis.utils import iface
                 if iface:
                     push_message(
                         iface.messageBar(),
@@ -209,6 +272,34 @@ class LineTool(BaseDrawingTool):
             # Reset for next line
             self.reset()
 
+    def _simplify(self, points_wgs84, tolerance_m):
+        """
+        Simplify a WGS84 polyline with Douglas-Peucker.
+
+        The tolerance is converted to degrees using the length of a degree of
+        latitude, which is never shorter than a degree of longitude, so no
+        vertex moves by more than tolerance_m.
+
+        Args:
+            points_wgs84: List of QgsPointXY in WGS84
+            tolerance_m: Maximum deviation in meters (0 disables)
+
+        Returns:
+            List of QgsPointXY in WGS84 (original list if nothing to simplify)
+        """
+        if tolerance_m <= 0 or len(points_wgs84) < 3:
+            return points_wgs84
+
+        tolerance_deg = tolerance_m / self.METERS_PER_DEGREE
+        simplified = QgsGeometry.fromPolylineXY(points_wgs84).simplify(tolerance_deg)
+        if not simplified or simplified.isEmpty():
+            return points_wgs84
+
+        simplified_points = simplified.asPolyline()
+        if len(simplified_points) < 2:
+            return points_wgs84
+        return simplified_points
+
     def cancel(self):
         """Cancel current line drawing."""
         self.reset()
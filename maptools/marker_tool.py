@@ -38,30 +38,37 @@ class MarkerMapTool(QgsMapTool):
         # Setup coordinate systems
         self.wgs84 = QgsCoordinateReferenceSystem("EPSG:4326")
         self.itm = QgsCoordinateReferenceSystem("EPSG:29903")  # Irish Transverse Mercator
-    
-    def canvasPressEvent(self, event):
-        """Handle mouse click on canvas."""
-        # Get click position in map coordinates
-        point = self.toMapCoordinates(event.pos())
-        
-        # Get canvas CRS
+
+        # Transforms from canvas CRS, rebuilt only when the canvas CRS changes
+        self._t_wgs84 = None
+        self._t_itm = None
+        self._rebuild_transforms()
+        self.canvas.destinationCrsChanged.connect(self._rebuild_transforms)
+
+    def _rebuild_transforms(self):
+        """Build canvas CRS -> WGS84 / ITM transforms for the current canvas CRS."""
         canvas_crs = self.canvas.mapSettings().destinationCrs()
-        
-        # Transform to WGS84
-        transform_to_wgs84 = QgsCoordinateTransform(
+        self._t_wgs84 = QgsCoordinateTransform(
             canvas_crs,
             self.wgs84,
             QgsProject.instance()
         )
-        wgs84_point = transform_to_wgs84.transform(point)
-        
-        # Transform to Irish Grid (ITM)
-        transform_to_itm = QgsCoordinateTransform(
+        self._t_itm = QgsCoordinateTransform(
             canvas_crs,
             self.itm,
             QgsProject.instance()
         )
-        itm_point = transform_to_itm.transform(point)
+    
+    def canvasPressEvent(self, event):
+        """Handle mouse click on canvas."""
+        # Get click position in map coordinates
+        point = self.toMapCoordinates(event.pos())
+        
+        # Transform to WGS84
+        wgs84_point = self._t_wgs84.transform(point)
+        
+        # Transform to Irish Grid (ITM)
+        itm_point = self._t_itm.transform(point)
         
         # Emit signal with coordinates
         self.marker_clicked.emit(
@@ -7,16 +7,18 @@ Custom QGIS map tool for measuring distance and bearing between two points.
 
 from qgis.core import (
     QgsPointXY, QgsCoordinateReferenceSystem, QgsCoordinateTransform,
-    QgsProject, QgsGeometry, QgsDistanceArea, QgsUnitTypes, QgsWkbTypes
+    QgsProject, QgsDistanceArea, QgsWkbTypes
 )
 from qgis.gui import QgsMapTool, QgsRubberBand
 from qgis.PyQt.QtCore import pyqtSignal
-from qgis.PyQt.QtGui import QCursor, QColor
-from math import atan2, degrees
+from qgis.PyQt.QtGui import QCursor
+from math import atan2, degrees, fmod, radians, sin, cos
 
 # Import Qt5/Qt6 compatible constants
 from ..utils.qt_compat import CrossCursor
 
+from .base_drawing_tool import PREVIEW_RB_COLOR, PREVIEW_RB_WIDTH
+
 
 class MeasureTool(QgsMapTool):
     """
@@ -46,8 +48,8 @@ class MeasureTool(QgsMapTool):
 
         # Rubber band for visual feedback
         self.rubber_band = QgsRubberBand(self.canvas, QgsWkbTypes.LineGeometry)
-        self.rubber_band.setColor(QColor(255, 0, 0, 180))  # Red, semi-transparent
-        self.rubber_band.setWidth(2)
+        self.rubber_band.setColor(PREVIEW_RB_COLOR)
+        self.rubber_band.setWidth(PREVIEW_RB_WIDTH)
 
         # Distance calculator
         self.distance_calc = QgsDistanceArea()
@@ -57,6 +59,32 @@ class MeasureTool(QgsMapTool):
         )
         self.distance_calc.setEllipsoid('WGS84')
 
+        # Canvas CRS -> WGS84 transform; while the tool is active it is
+        # rebuilt when the canvas CRS or the project's transform context
+        # (datum transformations) changes
+        self.wgs84 = QgsCoordinateReferenceSystem("EPSG:4326")
+        self._t_wgs84 = None
+        self._crs_signal_connected = False
+        self._rebuild_transform()
+
+    def _rebuild_transform(self):
+        """
+        Build the canvas CRS -> WGS84 transform for the current canvas CRS
+        and transform context.
+
+        Left as None when the canvas is already WGS84 (no transform needed).
+        """
+        canvas_crs = self.canvas.mapSettings().destinationCrs()
+        if canvas_crs.authid() == "EPSG:4326":
+            self._t_wgs84 = None
+            return
+
+        self._t_wgs84 = QgsCoordinateTransform(
+            canvas_crs,
+            self.wgs84,
+            QgsProject.instance()
+        )
+
     def canvasPressEvent(self, event):
         """Handle mouse click on canvas."""
         # Get click position in map coordinates
@@ -66,11 +94,12 @@ class MeasureTool(QgsMapTool):
             # First click - store starting point
             self.first_point = point
             self.rubber_band.reset(QgsWkbTypes.LineGeometry)
-            self.rubber_band.addPoint(point)
+            self.rubber_band.addPoint(point, False)
+            self.rubber_band.addPoint(point)  # Placeholder moved by canvasMoveEvent
         else:
             # Second click - calculate and emit results
             self.second_point = point
-            self.rubber_band.addPoint(point)
+            self.rubber_band.movePoint(1, point)
 
             # Calculate distance and bearing
             distance_m, distance_km, bearing = self._calculate_measurement()
@@ -94,9 +123,7 @@ class MeasureTool(QgsMapTool):
         if self.first_point is not None:
             # Show preview line from first point to cursor
             point = self.toMapCoordinates(event.pos())
-            self.rubber_band.reset(QgsWkbTypes.LineGeometry)
-            self.rubber_band.addPoint(self.first_point)
-            self.rubber_band.addPoint(point)
+            self.rubber_band.movePoint(1, point)
 
     def canvasReleaseEvent(self, event):
         """Handle mouse release (not used)."""
@@ -109,36 +136,29 @@ class MeasureTool(QgsMapTool):
         Returns:
             tuple: (distance_meters, distance_km, bearing_degrees)
         """
-        # Get canvas CRS
-        canvas_crs = self.canvas.mapSettings().destinationCrs()
-
         # Transform points to WGS84 for accurate distance calculation
-        wgs84 = QgsCoordinateReferenceSystem("EPSG:4326")
-        transform = QgsCoordinateTransform(
-            canvas_crs,
-            wgs84,
-            QgsProject.instance()
-        )
-
-        point1_wgs84 = transform.transform(self.first_point)
-        point2_wgs84 = transform.transform(self.second_point)
+        transform = self._t_wgs84
+        if transform is None:
+            # Canvas is already WGS84
+            point1_wgs84, point2_wgs84 = self.first_point, self.second_point
+        else:
+            point1_wgs84 = transform.transform(self.first_point)
+            point2_wgs84 = transform.transform(self.second_point)
 
         # Calculate distance using ellipsoidal calculation
         distance_m = self.distance_calc.measureLine(point1_wgs84, point2_wgs84)
         distance_km = distance_m / 1000.0
 
-        # Calculate bearing (azimuth)
+        # Calculate bearing (initial great-circle azimuth)
         # Bearing is the angle from north (0°) clockwise to the line
-        dx = point2_wgs84.x() - point1_wgs84.x()
-        dy = point2_wgs84.y() - point1_wgs84.y()
-
-        # atan2 gives angle from east, convert to bearing from north
-        angle_rad = atan2(dx, dy)
-        bearing = degrees(angle_rad)
-
+        lat1 = radians(point1_wgs84.y())
+        lat2 = radians(point2_wgs84.y())
+        dlon = radians(point2_wgs84.x() - point1_wgs84.x())
+        cos_lat2 = cos(lat2)
+        x = sin(dlon) * cos_lat2
+        y = cos(lat1) * sin(lat2) - sin(lat1) * cos_lat2 * cos(dlon)
         # Normalize to 0-360
-        if bearing < 0:
-            bearing += 360
+        bearing = fmod(degrees(atan2(x, y)) + 360.0, 360.0)
 
         return distance_m, distance_km, bearing
 
@@ -150,6 +170,13 @@ class MeasureTool(QgsMapTool):
         self.second_point = None
         self.rubber_band.reset(QgsWkbTypes.LineGeometry)
 
+        # CRS or transform context may have changed while inactive
+        self._rebuild_transform()
+        if not self._crs_signal_connected:
+            self.canvas.destinationCrsChanged.connect(self._rebuild_transform)
+            QgsProject.instance().transformContextChanged.connect(self._rebuild_transform)
+            self._crs_signal_connected = True
+
     def deactivate(self):
         """Called when tool is deactivated."""
         super().deactivate()
@@ -157,6 +184,17 @@ class MeasureTool(QgsMapTool):
         self.first_point = None
         self.second_point = None
 
+        if self._crs_signal_connected:
+            try:
+                self.canvas.destinationCrsChanged.disconnect(self._rebuild_transform)
+            except (TypeError, RuntimeError):
+                pass  # Already disconnected or canvas deleted
+            try:
+                QgsProject.instance().transformContextChanged.disconnect(self._rebuild_transform)
+            except (TypeError, RuntimeError):
+                pass  # Already disconnected
+            self._crs_signal_connected = False
+
     def isZoomTool(self):
         """Return False - this is not a zoom tool."""
         return False
@@ -8,14 +8,17 @@ Supports multi-click drawing with detailed area configuration dialog.
 Qt5/Qt6 Compatible: Uses qgis.PyQt and qt_compat for all Qt imports.
 """
 
-from qgis.core import QgsPointXY, QgsGeometry, QgsWkbTypes
+import logging
+from array import array
+
+from qgis.core import QgsPointXY, QgsGeometry, QgsLineString, QgsPolygon, QgsWkbTypes
 from qgis.gui import QgsRubberBand
-from qgis.PyQt.QtCore import Qt, QTimer
+from qgis.PyQt.QtCore import Qt, QEventLoop, QPoint, QTimer
 from qgis.PyQt.QtGui import QColor
 from qgis.PyQt.QtWidgets import (
-    QDialog, QVBoxLayout, QHBoxLayout, QLabel,
+    QApplication, QDialog, QVBoxLayout, QHBoxLayout, QLabel,
     QLineEdit, QPushButton, QComboBox, QTextEdit,
-    QGroupBox, QFormLayout, QDoubleSpinBox, QMessageBox
+    QGroupBox, QFormLayout, QDoubleSpinBox
 )
 
 # Import Qt5/Qt6 compatible constants and functions
@@ -23,6 +26,54 @@ from ..utils.qt_compat import LeftButton, RightButton, Key_Escape, dialog_exec,
 
 from .base_drawing_tool import BaseDrawingTool
 
+try:
+    from qgis.utils import iface
+except ImportError:
+    iface = None  # Running outside the QGIS application
+
+# Set up logger for this module
+logger = logging.getLogger(__name__)
+
+# Static option lists for the search area dialog
+_STATUSES = ("Planned", "Active", "Complete", "Suspended")
+_PRIORITIES = ("High", "Medium", "Low")
+_TERRAIN = (
+    "",
+    "Urban",
+    "Suburban",
+    "Rural",
+    "Forest - Dense",
+    "Forest - Light",
+    "Mountain",
+    "Coastal",
+    "Water",
+    "Agricultural",
+    "Scrubland",
+    "Mixed"
+)
+_METHODS = (
+    "",
+    "Ground - Hasty",
+    "Ground - Grid",
+    "Ground - Line",
+    "K9",
+    "Aerial - Helicopter",
+    "Aerial - Drone",
+    "Water - Shore",
+    "Water - Boat",
+    "Mixed Methods"
+)
+_COLORS = (
+    ("Blue", "#0064FF"),
+    ("Red", "#FF0000"),
+    ("Green", "#00FF00"),
+    ("Yellow", "#FFFF00"),
+    ("Orange", "#FFA500"),
+    ("Purple", "#800080"),
+    ("Pink", "#FF69B4"),
+    ("Cyan", "#00FFFF")
+)
+_COLOR_NAMES = tuple(name for name, _ in _COLORS)
 
 class SearchAreaDialog(QDialog):
     """
@@ -40,6 +91,9 @@ class SearchAreaDialog(QDialog):
     - Notes
     """
 
+    # Color name -> hex, in combo order
+    COLORS = dict(_COLORS)
+
     def __init__(self, area_sqkm, parent=None):
         """
         Initialize search area dialog.
@@ -69,8 +123,8 @@ class SearchAreaDialog(QDialog):
         info_group = QGroupBox("Area Information")
         info_layout = QVBoxLayout()
 
-        area_label = QLabel(f"<b>Calculated Area:</b> {self.area_sqkm:.3f} km² ({self.area_sqkm * 1000000:.0f} m²)")
-        info_layout.addWidget(area_label)
+        self.area_label = QLabel(self._format_area())
+        info_layout.addWidget(self.area_label)
 
         info_group.setLayout(info_layout)
         layout.addWidget(info_group)
@@ -92,12 +146,12 @@ class SearchAreaDialog(QDialog):
 
         # Status
         self.status_combo = QComboBox()
-        self.status_combo.addItems(["Planned", "Active", "Complete", "Suspended"])
+        self.status_combo.addItems(_STATUSES)
         props_layout.addRow("Status:", self.status_combo)
 
         # Priority
         self.priority_combo = QComboBox()
-        self.priority_combo.addItems(["High", "Medium", "Low"])
+        self.priority_combo.addItems(_PRIORITIES)
         self.priority_combo.setCurrentText("Medium")
         props_layout.addRow("Priority:", self.priority_combo)
 
@@ -113,53 +167,18 @@ class SearchAreaDialog(QDialog):
         # Terrain
         self.terrain_combo = QComboBox()
         self.terrain_combo.setEditable(True)
-        self.terrain_combo.addItems([
-            "",
-            "Urban",
-            "Suburban",
-            "Rural",
-            "Forest - Dense",
-            "Forest - Light",
-            "Mountain",
-            "Coastal",
-            "Water",
-            "Agricultural",
-            "Scrubland",
-            "Mixed"
-        ])
+        self.terrain_combo.addItems(_TERRAIN)
         props_layout.addRow("Terrain:", self.terrain_combo)
 
         # Search Method
         self.method_combo = QComboBox()
         self.method_combo.setEditable(True)
-        self.method_combo.addItems([
-            "",
-            "Ground - Hasty",
-            "Ground - Grid",
-            "Ground - Line",
-            "K9",
-            "Aerial - Helicopter",
-            "Aerial - Drone",
-            "Water - Shore",
-            "Water - Boat",
-            "Mixed Methods"
-        ])
+        self.method_combo.addItems(_METHODS)
         props_layout.addRow("Search Method:", self.method_combo)
 
         # Color picker (using combo with predefined colors)
         self.color_combo = QComboBox()
-        self.colors = {
-            "Blue": "#0064FF",
-            "Red": "#FF0000",
-            "Green": "#00FF00",
-            "Yellow": "#FFFF00",
-            "Orange": "#FFA500",
-            "Purple": "#800080",
-            "Pink": "#FF69B4",
-            "Cyan": "#00FFFF"
-        }
-        for color_name in self.colors.keys():
-            self.color_combo.addItem(color_name)
+        self.color_combo.addItems(_COLOR_NAMES)
         props_layout.addRow("Color:", self.color_combo)
 
         props_group.setLayout(props_layout)
@@ -189,31 +208,64 @@ class SearchAreaDialog(QDialog):
         cancel_btn.clicked.connect(self.reject)
         button_layout.addWidget(cancel_btn)
 
-        create_btn = QPushButton("Create Search Area")
-        create_btn.clicked.connect(self._create_area)
-        create_btn.setDefault(True)
-        button_layout.addWidget(create_btn)
+        self.create_btn = QPushButton("Create Search Area")
+        self.create_btn.clicked.connect(self._create_area)
+        self.create_btn.setDefault(True)
+        self.create_btn.setEnabled(False)  # Enabled once a name is entered
+        button_layout.addWidget(self.create_btn)
+        self.name_input.textChanged.connect(self._update_create_enabled)
 
         layout.addLayout(button_layout)
 
         self.setLayout(layout)
 
+    def _update_create_enabled(self, text):
+        """Only allow creating the area once a (non-blank) name is entered."""
+        self.create_btn.setEnabled(bool(text.strip()))
+
+    def _format_area(self):
+        """Format calculated area for display."""
+        return f"<b>Calculated Area:</b> {self.area_sqkm:.3f} km² ({self.area_sqkm * 1000000:.0f} m²)"
+
+    def reset(self, area_sqkm):
+        """
+        Prepare the dialog for reuse with a newly drawn polygon.
+
+        Restores every input to its initial value so the dialog behaves
+        exactly like a freshly constructed one.
+
+        Args:
+            area_sqkm: Calculated area in square kilometers (for display)
+        """
+        self.area_sqkm = area_sqkm
+        self.area_data = None
+        self.area_label.setText(self._format_area())
+
+        self.name_input.clear()
+        self.team_input.setText("Unassigned")
+        self.status_combo.setCurrentIndex(0)
+        self.priority_combo.setCurrentText("Medium")
+        self.poa_spin.setValue(50.0)
+        self.terrain_combo.setCurrentIndex(0)
+        self.terrain_combo.setEditText("")
+        self.method_combo.setCurrentIndex(0)
+        self.method_combo.setEditText("")
+        self.color_combo.setCurrentIndex(0)
+        self.notes_text.clear()
+        self.name_input.setFocus()
+
     def _create_area(self):
         """Validate input and prepare area data."""
         # Validate required fields
+        # Create button is disabled while the name is blank
         name = self.name_input.text().strip()
         if not name:
-            QMessageBox.warning(
-                self,
-                "Validation Error",
-                "Name is required. Please provide a name for the search area."
-            )
             self.name_input.setFocus()
             return
 
         # Get color hex value
         color_name = self.color_combo.currentText()
-        color = self.colors.get(color_name, "#0064FF")
+        color = self.COLORS.get(color_name, "#0064FF")
 
         # Prepare data dictionary
         self.area_data = {
@@ -241,6 +293,12 @@ class PolygonTool(BaseDrawingTool):
     Shows live preview with rubber band.
     """
 
+    # Minimum interval between preview redraws (~60 fps)
+    PREVIEW_INTERVAL_MS = 16
+
+    # Cursor moves shorter than this (Euclidean distance, pixels) don't redraw
+    MIN_PREVIEW_MOVE_PX = 1.0
+
     def __init__(self, canvas, layers_controller):
         """
         Initialize polygon drawing tool.
@@ -253,28 +311,147 @@ class PolygonTool(BaseDrawingTool):
         self.layers_controller = layers_controller
 
         # Polygon drawing state
-        self.points = []  # Points in canvas CRS
+        # Vertices in canvas CRS, stored as parallel coordinate arrays;
+        # QgsPointXY objects are only created at the boundaries (see points)
+        self._xs = array('d')
+        self._ys = array('d')
         self.is_drawing = False
+        self._dirty = False  # True once a vertex is added; reset() is a no-op otherwise
 
-        # Rubber band for preview
+        # Rubber band for preview; reused for every polygon while the tool is
+        # active (kept out of self.rubber_bands so clear_rubber_bands doesn't
+        # drop it) and released on deactivation
         self.polygon_rubber_band = None
 
+        # Configuration dialog, built on first use and reused afterwards
+        self._dialog = None
+
+        # Cached screen -> map affine (mupp, x_origin, y_origin); None until
+        # computed, False when the canvas is rotated (no simple affine)
+        self._xform = None
+        self._extent_signals_connected = False
+
+        # Coalesce mouse moves: only the latest cursor position is drawn,
+        # at most once per PREVIEW_INTERVAL_MS
+        self._pending_preview = None
+        self._last_preview_pos = QPoint()
+        self._move_timer = QTimer()
+        self._move_timer.setSingleShot(True)
+        self._move_timer.setInterval(self.PREVIEW_INTERVAL_MS)
+        self._move_timer.timeout.connect(self._flush_preview)
+
     def activate(self):
         """Called by QGIS when tool is activated."""
         super().activate()
         self.reset()
 
+        # Recompute the cached screen -> map affine only when the view changes
+        self._xform = None
+        if not self._extent_signals_connected:
+            self.canvas.extentsChanged.connect(self._invalidate_xform)
+            self.canvas.rotationChanged.connect(self._invalidate_xform)
+            self._extent_signals_connected = True
+
     def deactivate(self):
         """Called by QGIS when tool is deactivated."""
         super().deactivate()
         self.reset()
+        self._release_rubber_band()
+
+        if self._extent_signals_connected:
+            try:
+                self.canvas.extentsChanged.disconnect(self._invalidate_xform)
+                self.canvas.rotationChanged.disconnect(self._invalidate_xform)
+            except (TypeError, RuntimeError):
+                pass  # Already disconnected or canvas deleted
+            self._extent_signals_connected = False
+        self._xform = None
+
+    def _invalidate_xform(self, *args):
+        """Drop the cached screen -> map affine (extent/scale/rotation changed)."""
+        self._xform = None
+
+    def _to_map(self, pos):
+        """
+        Convert a canvas pixel position to map coordinates.
+
+        Uses a cached affine for unrotated canvases instead of going through
+        the canvas coordinate transform on every event.
+
+        Args:
+            pos: QPoint in canvas pixels
+
+        Returns:
+            QgsPointXY in canvas CRS
+        """
+        xform = self._xform
+        if xform is None:
+            settings = self.canvas.mapSettings()
+            if settings.rotation() != 0:
+                xform = False
+            else:
+                extent = settings.visibleExtent()
+                xform = (settings.mapUnitsPerPixel(), extent.xMinimum(), extent.yMaximum())
+            # Only cache while the invalidation signals are connected
+            if self._extent_signals_connected:
+                self._xform = xform
+
+        if xform is False:
+            return self.toMapCoordinates(pos)
+
+        mupp, x_origin, y_origin = xform
+        return QgsPointXY(x_origin + pos.x() * mupp, y_origin - pos.y() * mupp)
+
+    @property
+    def points(self):
+        """List of QgsPointXY vertices in canvas CRS (built on demand)."""
+        return [QgsPointXY(x, y) for x, y in zip(self._xs, self._ys)]
+
+    def _clear_vertices(self):
+        """Drop all vertices."""
+        del self._xs[:]
+        del self._ys[:]
 
     def reset(self):
         """Reset ALL state to initial conditions."""
-        self.points = []
+        if not self._dirty:
+            return  # Nothing drawn since the last reset
+
+        self._dirty = False
+        self._clear_vertices()
         self.is_drawing = False
+        self._move_timer.stop()
+        self._pending_preview = None
+        self._last_preview_pos = QPoint()
         self.clear_rubber_bands()
+
+    def clear_rubber_bands(self):
+        """Clear previews, hiding (not deleting) the pooled polygon rubber band."""
+        super().clear_rubber_bands()
+        if self.polygon_rubber_band is not None:
+            try:
+                self.polygon_rubber_band.reset(QgsWkbTypes.PolygonGeometry)
+                self.polygon_rubber_band.hide()
+            except RuntimeError:
+                self.polygon_rubber_band = None  # Deleted along with the canvas
+
+    def _release_rubber_band(self):
+        """
+        Remove the pooled polygon rubber band from the canvas scene.
+
+        The band is reused across polygons while the tool is active; on
+        deactivation (including plugin unload) it is taken out of the scene
+        so no orphaned item is left behind.
+        """
+        band = self.polygon_rubber_band
+        if band is None:
+            return
         self.polygon_rubber_band = None
+        try:
+            if self.canvas and self.canvas.scene():
+                self.canvas.scene().removeItem(band)
+        except RuntimeError:
+            pass  # Already deleted along with the canvas
 
     def canvasPressEvent(self, event):
         """
@@ -286,20 +463,24 @@ class PolygonTool(BaseDrawingTool):
         Args:
             event: QgsMapMouseEvent
         """
-        print(f"[POLYGON TOOL] canvasPressEvent called! is_active={self.is_active}, canvas.mapTool()={self.canvas.mapTool()}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("canvasPressEvent: is_active=%s, canvas.mapTool()=%s",
+                         self.is_active, self.canvas.mapTool())
 
         if event.button() == LeftButton:
             # Add vertex
-            point = self.toMapCoordinates(event.pos())
-            self.points.append(point)
+            point = self._to_map(event.pos())
+            self._xs.append(point.x())
+            self._ys.append(point.y())
             self.is_drawing = True
+            self._dirty = True
 
             # Update preview
             self._update_rubber_band()
 
         elif event.button() == RightButton:
             # Finish polygon
-            if len(self.points) < 3:
+            if len(self._xs) < 3:
                 self.cancel()
                 return
 
@@ -313,10 +494,23 @@ class PolygonTool(BaseDrawingTool):
         Args:
             event: QgsMapMouseEvent
         """
-        if self.is_drawing and len(self.points) > 0:
-            # Show preview polygon from vertices to cursor
-            current_pos = self.toMapCoordinates(event.pos())
-            self._update_rubber_band(preview_point=current_pos)
+        if self.is_drawing and len(self._xs) > 0:
+            # Ignore jitter that wouldn't visibly change the preview
+            pos = event.pos()
+            delta = pos - self._last_preview_pos
+            if delta.x() * delta.x() + delta.y() * delta.y() < self.MIN_PREVIEW_MOVE_PX * self.MIN_PREVIEW_MOVE_PX:
+                return
+            self._last_preview_pos = pos
+
+            # Store cursor position; preview is redrawn by _flush_preview
+            self._pending_preview = self._to_map(pos)
+            if not self._move_timer.isActive():
+                self._move_timer.start()
+
+    def _flush_preview(self):
+        """Draw the preview polygon to the latest cursor position."""
+        if self.is_drawing and self._xs and self._pending_preview is not None:
+            self._update_rubber_band(preview_point=self._pending_preview)
 
     def keyPressEvent(self, event):
         """
@@ -341,8 +535,8 @@ class PolygonTool(BaseDrawingTool):
         if not self.canvas or not self.canvas.scene():
             return
 
-        # Create rubber band if needed
-        if not self.polygon_rubber_band:
+        # Create rubber band on first use
+        if self.polygon_rubber_band is None:
             self.polygon_rubber_band = QgsRubberBand(
                 self.canvas,
                 QgsWkbTypes.PolygonGeometry  # POLYGON, not LINE!
@@ -350,21 +544,24 @@ class PolygonTool(BaseDrawingTool):
             self.polygon_rubber_band.setColor(QColor(0, 100, 255, 100))  # Semi-transparent blue
             self.polygon_rubber_band.setFillColor(QColor(0, 100, 255, 40))  # Light fill
             self.polygon_rubber_band.setWidth(2)
-            self.rubber_bands.append(self.polygon_rubber_band)
 
-        # Build preview points list
-        preview_points = list(self.points)
-        if preview_point:
-            preview_points.append(preview_point)
-
-        # Reset and rebuild rubber band
-        self.polygon_rubber_band.reset(QgsWkbTypes.PolygonGeometry)
-        for point in preview_points:
-            self.polygon_rubber_band.addPoint(point)
+        # Build preview ring straight from the coordinate arrays
+        xs = self._xs.tolist()
+        ys = self._ys.tolist()
+        if preview_point is not None:
+            xs.append(preview_point.x())
+            ys.append(preview_point.y())
+        ring = QgsLineString(xs, ys)
 
         # Close polygon visually if 3+ points
-        if len(preview_points) >= 3:
-            self.polygon_rubber_band.addPoint(preview_points[0])  # Close the ring
+        if len(xs) >= 3:
+            ring.close()
+
+        polygon = QgsPolygon()
+        polygon.setExteriorRing(ring)
+
+        # Rebuild rubber band in one call (setToGeometry resets it first)
+        self.polygon_rubber_band.setToGeometry(QgsGeometry(polygon), None)
 
         # Force update
         self.polygon_rubber_band.show()
@@ -383,19 +580,39 @@ class PolygonTool(BaseDrawingTool):
             return 0.0
 
         try:
-            # Create polygon geometry
-            polygon = QgsGeometry.fromPolygonXY([points_wgs84])
+            # Build the polygon directly; QgsGeometry takes ownership of it
+            # instead of copying the vertices again
+            ring = QgsLineString(points_wgs84)
+            ring.close()
+            polygon = QgsPolygon()
+            polygon.setExteriorRing(ring)
 
             # Calculate area using distance calculator (geodesic)
-            area_sqm = self.distance_calc.measureArea(polygon)
+            area_sqm = self.distance_calc.measureArea(QgsGeometry(polygon))
 
             # Convert to km²
             return area_sqm / 1_000_000
 
         except Exception as e:
-            print(f"Error calculating area: {e}")
+            logger.error("Error calculating area: %s", e)
             return 0.0
 
+    def _get_dialog(self, area_sqkm):
+        """
+        Get the search area dialog, ready for a new polygon.
+
+        Args:
+            area_sqkm: Calculated area in square kilometers
+
+        Returns:
+            SearchAreaDialog
+        """
+        if self._dialog is None:
+            self._dialog = SearchAreaDialog(area_sqkm, None)
+        else:
+            self._dialog.reset(area_sqkm)
+        return self._dialog
+
     def _finish_polygon(self):
         """
         Complete polygon drawing and show configuration dialog.
@@ -404,24 +621,36 @@ class PolygonTool(BaseDrawingTool):
         - Tool remains active during dialog
         - Signal handler deactivates tool after completion
         """
-        if len(self.points) < 3:
+        if len(self._xs) < 3:
             self.cancel()
             return
 
-        # Transform to WGS84
-        points_wgs84 = [self.transform_to_wgs84(p) for p in self.points]
+        # Transform to WGS84 (all vertices in one call)
+        points_wgs84 = self.transform_points_to_wgs84(self.points)
 
         # Calculate area for dialog
         area_sqkm = self._calculate_area(points_wgs84)
 
+        # Degenerate polygon (collinear/duplicate vertices or failed measure):
+        # nothing worth configuring, so don't build or show the dialog
+        if area_sqkm <= 0.0:
+            if iface:
+                push_message(
+                    iface.messageBar(),
+                    "Invalid Search Area",
+                    "Polygon has zero area - check the vertices and draw again.",
+                    level=1,  # Warning
+                    duration=5
+                )
+            self.cancel()
+            return
+
         # Show dialog while tool is still active (same as range_ring/bearing)
-        dialog = SearchAreaDialog(area_sqkm, None)
+        dialog = self._get_dialog(area_sqkm)
 
         result = dialog_exec(dialog)
 
         # CRITICAL: Force Qt to process all pending events from dialog
-        from qgis.PyQt.QtCore import QEventLoop
-        from qgis.PyQt.QtWidgets import QApplication
         QApplication.processEvents(QEventLoop.AllEvents, 100)
 
         if result == DialogAccepted and dialog.area_data:
@@ -429,14 +658,11 @@ class PolygonTool(BaseDrawingTool):
             self._create_search_area(points_wgs84, dialog.area_data)
         else:
             # User cancelled
-            self.points = []
+            self._clear_vertices()
             self.drawing_cancelled.emit()
 
-        # Clean up dialog explicitly
-        dialog.deleteLater()
-
         # Clean up state after dialog
-        self.points = []
+        self._clear_vertices()
         self.clear_rubber_bands()
 
     def _create_search_area(self, points_wgs84, area_data):
@@ -447,14 +673,19 @@ class PolygonTool(BaseDrawingTool):
             points_wgs84: List of QgsPointXY in WGS84
             area_data: Dict with area properties from dialog
         """
+        name = area_data['name']
+        team = area_data['team']
+        status = area_data['status']
+        priority = area_data['priority']
+
         try:
             # Save to layer via controller
             feature_id = self.layers_controller.add_search_area(
-                name=area_data['name'],
+                name=name,
                 polygon_wgs84=points_wgs84,
-                team=area_data['team'],
-                status=area_data['status'],
-                priority=area_data['priority'],
+                team=team,
+                status=status,
+                priority=priority,
                 POA=area_data['POA'],
                 terrain=area_data['terrain'],
                 search_method=area_data['search_method'],
@@ -466,20 +697,17 @@ class PolygonTool(BaseDrawingTool):
             self.drawing_complete.emit({
                 'type': 'search_area',
                 'feature_id': feature_id,
-                'name': area_data['name'],
-                'team': area_data['team'],
-                'status': area_data['status'],
-                'priority': area_data['priority'],
+                'name': name,
+                'team': team,
+                'status': status,
+                'priority': priority,
                 'vertices': len(points_wgs84)
             })
 
         except Exception as e:
-            print(f"Error saving search area: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("Error saving search area: %s", e)
             # Show error to user
             try:
-                from qgis.utils import iface
                 if iface:
                     push_message(
                         iface.messageBar(),
@@ -493,7 +721,7 @@ class PolygonTool(BaseDrawingTool):
 
         finally:
             # Reset for next polygon (same as range_ring pattern)
-            self.points = []
+            self._clear_vertices()
             self.clear_rubber_bands()
 
     def cancel(self):
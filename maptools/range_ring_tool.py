@@ -8,6 +8,9 @@ Supports manual radius entry or LPB (Lost Person Behavior) statistics.
 Qt5/Qt6 Compatible: Uses qgis.PyQt and qt_compat for all Qt imports.
 """
 
+import logging
+import math
+
 from qgis.core import QgsPointXY, QgsGeometry, QgsWkbTypes
 from qgis.gui import QgsRubberBand
 from qgis.PyQt.QtCore import Qt
@@ -15,7 +18,7 @@ from qgis.PyQt.QtGui import QColor
 from qgis.PyQt.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel,
     QLineEdit, QPushButton, QRadioButton, QComboBox,
-    QCheckBox, QGroupBox, QButtonGroup, QSpinBox
+    QCheckBox, QGroupBox, QButtonGroup, QSpinBox, QMessageBox
 )
 
 # Import Qt5/Qt6 compatible constants and functions
@@ -24,6 +27,14 @@ from ..utils.lpb_statistics import LPBStatistics
 
 from .base_drawing_tool import BaseDrawingTool
 
+try:
+    from qgis.utils import iface
+except ImportError:
+    iface = None  # Running outside the QGIS application
+
+# Set up logger for this module
+logger = logging.getLogger(__name__)
+
 
 class RangeRingDialog(QDialog):
     """
@@ -34,6 +45,9 @@ class RangeRingDialog(QDialog):
     - LPB: Subject category with percentile-based rings
     """
 
+    # Largest accepted manual radius (100km maximum for SAR operations)
+    MAX_RADIUS_M = 100000
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setWindowTitle("Create Range Rings")
@@ -43,6 +57,9 @@ class RangeRingDialog(QDialog):
         # Result data
         self.ring_data = None
 
+        # LPB categories are only loaded once LPB mode is first selected
+        self._categories_loaded = False
+
         self._setup_ui()
 
     def _setup_ui(self):
@@ -103,7 +120,6 @@ class RangeRingDialog(QDialog):
         category_layout = QHBoxLayout()
         category_layout.addWidget(QLabel("Subject Category:"))
         self.category_combo = QComboBox()
-        self.category_combo.addItems(LPBStatistics.get_all_categories())
         category_layout.addWidget(self.category_combo)
         lpb_layout.addLayout(category_layout)
 
@@ -133,8 +149,30 @@ class RangeRingDialog(QDialog):
         # Connect signals
         self.manual_radio.toggled.connect(self._on_mode_changed)
         self.lpb_radio.toggled.connect(self._on_mode_changed)
+        self.lpb_radio.toggled.connect(self._load_categories)
         self.multiple_check.toggled.connect(self.num_rings_spin.setEnabled)
 
+    def _load_categories(self, checked):
+        """Populate the LPB category list the first time LPB mode is selected."""
+        if checked and not self._categories_loaded:
+            self.category_combo.addItems(LPBStatistics.get_all_categories())
+            self._categories_loaded = True
+
+    def reset(self):
+        """
+        Prepare the dialog for reuse.
+
+        Restores every input to its initial value so the dialog behaves
+        exactly like a freshly constructed one.
+        """
+        self.ring_data = None
+        self.manual_radio.setChecked(True)
+        self.radius_input.setText("1000")
+        self.multiple_check.setChecked(False)
+        self.num_rings_spin.setValue(3)
+        self.category_combo.setCurrentIndex(0)
+        self.radius_input.setFocus()
+
     def _on_mode_changed(self):
         """Handle mode radio button changes."""
         is_manual = self.manual_radio.isChecked()
@@ -145,57 +183,42 @@ class RangeRingDialog(QDialog):
         """Validate input and prepare ring data."""
         if self.manual_radio.isChecked():
             # Manual mode
+            # Positive, finite and at most 100km (maximum for SAR operations)
             try:
                 radius = float(self.radius_input.text())
-                if radius <= 0:
-                    raise ValueError("Radius must be positive")
-                if radius > 100000:  # 100km maximum for SAR operations
-                    raise ValueError("Radius too large (maximum 100,000m = 100km)")
-                if not (0 < radius < float('inf')):
-                    raise ValueError("Invalid radius value")
-            except ValueError as e:
-                from qgis.PyQt.QtWidgets import QMessageBox
+                valid = math.isfinite(radius) and 0 < radius <= self.MAX_RADIUS_M
+            except ValueError:
+                valid = False
+            if not valid:
                 QMessageBox.warning(self, "Invalid Input",
-                                  f"Please enter a valid positive number for radius (max 100km).\n{e}")
+                                  "Please enter a valid positive number for radius (max 100,000m = 100km).")
                 return
 
-            if self.multiple_check.isChecked():
-                num_rings = self.num_rings_spin.value()
-                # Create evenly spaced rings
-                self.ring_data = {
-                    'mode': 'manual',
-                    'rings': [
-                        {
-                            'radius_m': radius * (i + 1) / num_rings,
-                            'label': f"{radius * (i + 1) / num_rings:.0f}m"
-                        }
-                        for i in range(num_rings)
-                    ]
-                }
-            else:
-                self.ring_data = {
-                    'mode': 'manual',
-                    'rings': [
-                        {
-                            'radius_m': radius,
-                            'label': f"{radius:.0f}m"
-                        }
-                    ]
-                }
+            # One ring, or evenly spaced concentric rings
+            num_rings = self.num_rings_spin.value() if self.multiple_check.isChecked() else 1
+            radii = [radius * (i + 1) / num_rings for i in range(num_rings)]
+            self.ring_data = {
+                'mode': 'manual',
+                'rings': [
+                    {
+                        'radius_m': ring_radius,
+                        'label': f"{ring_radius:.0f}m"
+                    }
+                    for ring_radius in radii
+                ]
+            }
         else:
             # LPB mode
             category_name = self.category_combo.currentText()
             category_key = LPBStatistics.get_category_from_display_name(category_name)
 
             if not category_key:
-                from qgis.PyQt.QtWidgets import QMessageBox
                 QMessageBox.warning(self, "Error", "Invalid category selected")
                 return
 
             distances = LPBStatistics.get_distances(category_key, [25, 50, 75, 95])
 
             if not distances or len(distances) == 0:
-                from qgis.PyQt.QtWidgets import QMessageBox
                 QMessageBox.warning(self, "Error", "Failed to load LPB statistics for this category")
                 return
 
@@ -224,6 +247,15 @@ class RangeRingTool(BaseDrawingTool):
     Supports both manual radii and LPB statistics.
     """
 
+    # LPB ring colors by percentile
+    LPB_COLORS = {
+        25: "#00FF00",  # Green - highest probability
+        50: "#FFFF00",  # Yellow
+        75: "#FFA500",  # Orange
+        95: "#FF0000",  # Red - lowest probability
+    }
+    DEFAULT_RING_COLOR = "#FFA500"
+
     def __init__(self, canvas, layers_controller):
         """
         Initialize range ring tool.
@@ -239,6 +271,12 @@ class RangeRingTool(BaseDrawingTool):
         self.center_point = None  # Canvas CRS
         self.preview_rubber_band = None
 
+        # Configuration dialog, built on first use and reused afterwards
+        self._dialog = None
+
+        # Manual ring gradient colors, keyed by (index, total)
+        self._ring_color_cache = {}
+
     def activate(self):
         """Called when tool is activated."""
         super().activate()
@@ -277,7 +315,11 @@ class RangeRingTool(BaseDrawingTool):
     def _show_dialog(self):
         """Show range ring configuration dialog."""
         # Use None as parent since canvas is not a QWidget
-        dialog = RangeRingDialog(None)
+        if self._dialog is None:
+            self._dialog = RangeRingDialog(None)
+        else:
+            self._dialog.reset()
+        dialog = self._dialog
 
         if dialog_exec(dialog) == DialogAccepted and dialog.ring_data:
             self._create_rings(dialog.ring_data)
@@ -297,9 +339,9 @@ class RangeRingTool(BaseDrawingTool):
             center_wgs84 = self.transform_to_wgs84(self.center_point)
 
             is_lpb = ring_data['mode'] == 'lpb'
-            feature_ids = []
+            specs = []
 
-            # Create each ring
+            # Describe each ring; they are added to the layer in one batch
             for i, ring in enumerate(ring_data['rings']):
                 radius_m = ring['radius_m']
                 label = ring['label']
@@ -316,18 +358,24 @@ class RangeRingTool(BaseDrawingTool):
                     lpb_category = ""
                     percentile = 0
 
-                # Add to layer
-                feature_id = self.layers_controller.add_range_ring(
-                    name=name,
-                    center_wgs84=center_wgs84,
-                    radius_m=radius_m,
-                    label=label,
-                    color=color,
-                    lpb_category=lpb_category,
-                    percentile=percentile
-                )
-
-                feature_ids.append(feature_id)
+                specs.append({
+                    'name': name,
+                    'radius_m': radius_m,
+                    'label': label,
+                    'color': color,
+                    'lpb_category': lpb_category,
+                    'percentile': percentile
+                })
+
+            # Add to layer (single edit session). Canvas rendering is paused
+            # meanwhile so layer creation/commit/repaint redraw only once.
+            was_rendering = self.canvas.renderFlag()
+            self.canvas.setRenderFlag(False)
+            try:
+                feature_ids = self.layers_controller.add_range_rings(center_wgs84, specs)
+            finally:
+                # Restore the user's setting; re-enabling refreshes the canvas
+                self.canvas.setRenderFlag(was_rendering)
 
             # Emit completion signal
             self.drawing_complete.emit({
@@ -340,22 +388,16 @@ class RangeRingTool(BaseDrawingTool):
             })
 
         except Exception as e:
-            print(f"Error creating range rings: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("Error creating range rings: %s", e)
             # Show error to user
-            try:
-                from qgis.utils import iface
-                if iface:
-                    push_message(
-                        iface.messageBar(),
-                        "Error",
-                        f"Failed to create range rings: {str(e)}",
-                        level=2,  # Warning
-                        duration=5
-                    )
-            except:
-                pass  # iface not available
+            if iface:
+                push_message(
+                    iface.messageBar(),
+                    "Error",
+                    f"Failed to create range rings: {str(e)}",
+                    level=2,  # Warning
+                    duration=5
+                )
 
         finally:
             # Reset for next ring set
@@ -372,13 +414,7 @@ class RangeRingTool(BaseDrawingTool):
         Returns:
             Hex color string
         """
-        colors = {
-            25: "#00FF00",  # Green - highest probability
-            50: "#FFFF00",  # Yellow
-            75: "#FFA500",  # Orange
-            95: "#FF0000",  # Red - lowest probability
-        }
-        return colors.get(percentile, "#FFA500")
+        return self.LPB_COLORS.get(percentile, self.DEFAULT_RING_COLOR)
 
     def _get_ring_color(self, index, total):
         """
@@ -393,11 +429,16 @@ class RangeRingTool(BaseDrawingTool):
         """
         # Gradient from light to dark orange
         if total == 1:
-            return "#FFA500"
-
-        # Calculate brightness (255 = lightest, 100 = darkest)
-        brightness = 255 - int((index / (total - 1)) * 155)
-        return f"#{brightness:02x}a500"
+            return self.DEFAULT_RING_COLOR
+
+        key = (index, total)
+        color = self._ring_color_cache.get(key)
+        if color is None:
+            # Calculate brightness (255 = lightest, 100 = darkest)
+            brightness = 255 - int((index / (total - 1)) * 155)
+            color = f"#{brightness:02x}a500"
+            self._ring_color_cache[key] = color
+        return color
 
     def cancel(self):
         """Cancel current operation."""
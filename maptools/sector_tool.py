@@ -9,10 +9,10 @@ Useful for SAR operations to define directional search areas.
 from qgis.core import (
     QgsPointXY, QgsCoordinateReferenceSystem, QgsCoordinateTransform,
     QgsProject, QgsGeometry, QgsFeature, QgsVectorLayer, QgsField,
-    QgsWkbTypes, QgsDistanceArea
+    QgsWkbTypes, QgsDistanceArea, QgsLineString, QgsPolygon
 )
 from qgis.gui import QgsMapTool, QgsRubberBand, QgsVertexMarker
-from qgis.PyQt.QtCore import pyqtSignal
+from qgis.PyQt.QtCore import pyqtSignal, QTimer
 from qgis.PyQt.QtGui import QCursor, QColor
 import math
 
@@ -40,6 +40,17 @@ class SearchSectorTool(QgsMapTool):
     STATE_RADIUS = 1
     STATE_ANGLE = 2
 
+    # Approximate length of one degree of latitude (meters)
+    METERS_PER_DEGREE = 111320.0
+
+    # Preview arcs: target on-screen edge length (pixels) and segment bounds
+    PREVIEW_PX_PER_SEGMENT = 4
+    PREVIEW_MIN_SEGMENTS = 8
+    PREVIEW_MAX_SEGMENTS = 256
+
+    # Minimum interval between preview redraws (~60 fps)
+    PREVIEW_INTERVAL_MS = 16
+
     def __init__(self, canvas):
         """
         Initialize search sector tool.
@@ -63,6 +74,14 @@ class SearchSectorTool(QgsMapTool):
         self.radius_band = None
         self.sector_band = None
 
+        # Coalesce mouse moves: only the latest cursor position is previewed,
+        # at most once per PREVIEW_INTERVAL_MS
+        self._pending_pos = None
+        self._move_timer = QTimer()
+        self._move_timer.setSingleShot(True)
+        self._move_timer.setInterval(self.PREVIEW_INTERVAL_MS)
+        self._move_timer.timeout.connect(self._flush_preview)
+
         # Setup coordinate systems
         self.wgs84 = QgsCoordinateReferenceSystem("EPSG:4326")
 
@@ -71,18 +90,47 @@ class SearchSectorTool(QgsMapTool):
         self.distance_calc.setSourceCrs(self.wgs84, QgsProject.instance().transformContext())
         self.distance_calc.setEllipsoid('WGS84')
 
-    def canvasPressEvent(self, event):
-        """Handle mouse click - multi-step sector creation."""
-        point = self.toMapCoordinates(event.pos())
+        # Cached canvas <-> WGS84 transforms; while the tool is active they
+        # are rebuilt when the canvas CRS or the project's transform context
+        # (datum transformations) changes
+        self._t_to_wgs84 = None
+        self._t_from_wgs84 = None
+        self._canvas_is_wgs84 = False
+        self._crs_signal_connected = False
 
-        # Transform to WGS84 for consistent calculations
+        # Incremental sector preview state (see show_sector_preview)
+        self._arc_params = None  # (cx, cy, lat_deg, lon_deg, step_deg)
+        self._arc_vertices = []  # Canvas CRS vertices at start + k * step
+        self._arc_center = None  # Center in canvas CRS
+        self._sector_band_steps = None  # Full steps drawn in sector_band
+
+        self._rebuild_transforms()
+
+    def _rebuild_transforms(self):
+        """Build canvas CRS <-> WGS84 transforms for the current canvas CRS and transform context."""
         canvas_crs = self.canvas.mapSettings().destinationCrs()
-        transform = QgsCoordinateTransform(
+        self._canvas_is_wgs84 = canvas_crs.authid() == "EPSG:4326"
+        self._t_to_wgs84 = QgsCoordinateTransform(
             canvas_crs,
             self.wgs84,
             QgsProject.instance()
         )
-        point_wgs84 = transform.transform(point)
+        self._t_from_wgs84 = QgsCoordinateTransform(
+            self.wgs84,
+            canvas_crs,
+            QgsProject.instance()
+        )
+
+        # Cached preview vertices are in the old canvas CRS
+        self._arc_params = None
+        self._sector_band_steps = None
+
+    def canvasPressEvent(self, event):
+        """Handle mouse click - multi-step sector creation."""
+        point = self.toMapCoordinates(event.pos())
+
+        # Transform to WGS84 for consistent calculations
+        point_wgs84 = point if self._canvas_is_wgs84 else self._t_to_wgs84.transform(point)
 
         if self.state == self.STATE_START:
             # First click: Set center
@@ -92,6 +140,7 @@ class SearchSectorTool(QgsMapTool):
 
         elif self.state == self.STATE_RADIUS:
             # Second click: Set radius and start angle
+            # Saved radius stays ellipsoidal; only the bearing is spherical
             self.radius = self.calculate_distance(self.center, point_wgs84)
             self.start_angle = self.calculate_bearing(self.center, point_wgs84)
             self.show_radius_line(self.center, point_wgs84)
@@ -121,16 +170,20 @@ class SearchSectorTool(QgsMapTool):
         if self.state == self.STATE_START:
             return  # No preview in initial state
 
-        point = self.toMapCoordinates(event.pos())
+        # Store cursor position; preview is redrawn by _flush_preview
+        self._pending_pos = event.pos()
+        if not self._move_timer.isActive():
+            self._move_timer.start()
+
+    def _flush_preview(self):
+        """Draw the preview for the latest cursor position."""
+        if self.state == self.STATE_START or self._pending_pos is None:
+            return
+
+        point = self.toMapCoordinates(self._pending_pos)
 
         # Transform to WGS84
-        canvas_crs = self.canvas.mapSettings().destinationCrs()
-        transform = QgsCoordinateTransform(
-            canvas_crs,
-            self.wgs84,
-            QgsProject.instance()
-        )
-        point_wgs84 = transform.transform(point)
+        point_wgs84 = point if self._canvas_is_wgs84 else self._t_to_wgs84.transform(point)
 
         if self.state == self.STATE_RADIUS:
             # Show radius preview
@@ -186,6 +239,24 @@ class SearchSectorTool(QgsMapTool):
         # Normalize to 0-360
         return (bearing + 360) % 360
 
+    def _degree_scales(self, center, radius):
+        """
+        Convert a radius in meters to degrees of latitude and longitude.
+
+        Local equirectangular scale: a degree of longitude shrinks with
+        cos(latitude); clamped so the scale stays finite at the poles.
+
+        Args:
+            center: Center point (QgsPointXY) in WGS84
+            radius: Radius in meters
+
+        Returns:
+            tuple: (lat_deg, lon_deg)
+        """
+        lat_deg = radius / self.METERS_PER_DEGREE
+        lon_deg = lat_deg / max(1e-6, math.cos(math.radians(center.y())))
+        return lat_deg, lon_deg
+
     def create_sector_geometry(self, center, radius, start_angle, end_angle):
         """
         Create a sector (wedge) geometry.
@@ -197,10 +268,9 @@ class SearchSectorTool(QgsMapTool):
             end_angle: End angle in degrees
 
         Returns:
-            QgsGeometry polygon representing the sector
+            tuple: (QgsGeometry polygon representing the sector,
+                    arc length in degrees, measured clockwise from start to end)
         """
-        points = [center]  # Start at center
-
         # Normalize angles
         start = start_angle % 360
         end = end_angle % 360
@@ -213,28 +283,31 @@ class SearchSectorTool(QgsMapTool):
         arc_length = end - start
         segments = max(10, int(arc_length / 5))  # One point every 5 degrees
 
-        # Create arc points
-        for i in range(segments + 1):
-            angle = start + (arc_length * i / segments)
-            angle_rad = math.radians(angle)
-
-            # Approximate distance in degrees
-            dist_deg = radius / 111000.0  # Rough approximation
+        lat_deg, lon_deg = self._degree_scales(center, radius)
 
-            # Calculate point position
-            dx = dist_deg * math.sin(angle_rad)
-            dy = dist_deg * math.cos(angle_rad)
+        # Walk the arc by rotating a unit vector through a fixed step, so
+        # trig is evaluated once per sector rather than once per vertex
+        step = math.radians(arc_length / segments)
+        sin_step, cos_step = math.sin(step), math.cos(step)
+        start_rad = math.radians(start)
+        s, c = math.sin(start_rad), math.cos(start_rad)
+        cx, cy = center.x(), center.y()
 
-            point = QgsPointXY(
-                center.x() + dx,
-                center.y() + dy
-            )
-            points.append(point)
+        # Ring coordinates: center, arc, back to center. Preallocated and
+        # filled as plain floats; no QgsPointXY per vertex
+        count = segments + 3
+        xs = [cx] * count
+        ys = [cy] * count
 
-        # Close back to center
-        points.append(center)
+        # Create arc points
+        for i in range(1, segments + 2):
+            xs[i] = cx + lon_deg * s
+            ys[i] = cy + lat_deg * c
+            s, c = s * cos_step + c * sin_step, c * cos_step - s * sin_step
 
-        return QgsGeometry.fromPolygonXY([points])
+        polygon = QgsPolygon()
+        polygon.setExteriorRing(QgsLineString(xs, ys))
+        return QgsGeometry(polygon), arc_length
 
     def create_sector_layer(self):
         """
@@ -257,21 +330,18 @@ class SearchSectorTool(QgsMapTool):
 
         provider = layer.dataProvider()
 
-        # Create sector geometry
-        geometry = self.create_sector_geometry(
+        # Create sector geometry; the arc length is the clockwise sweep the
+        # geometry was actually built with
+        geometry, arc_length = self.create_sector_geometry(
             self.center,
             self.radius,
             self.start_angle,
             self.end_angle
         )
 
-        # Calculate arc length
-        arc_length = abs(self.end_angle - self.start_angle)
-        if arc_length > 180:
-            arc_length = 360 - arc_length
-
         # Calculate area (approximate)
-        area_sqm = (math.pi * self.radius * self.radius) * (arc_length / 360)
+        radius = self.radius
+        area_sqm = math.pi * radius * radius * (arc_length / 360)
         area_sqkm = area_sqm / 1000000
 
         # Create feature
@@ -313,68 +383,136 @@ class SearchSectorTool(QgsMapTool):
                 symbol.symbolLayer(0).setStrokeColor(QColor(0, 100, 255, 200))
                 symbol.symbolLayer(0).setStrokeWidth(2.0)
 
+    def _create_visuals(self):
+        """
+        Create the center marker and preview rubber bands.
+
+        Built on activation and reused for every sector; reset() only
+        clears them and deactivate() removes them (see _release_visuals).
+        """
+        if self.center_marker is None:
+            self.center_marker = QgsVertexMarker(self.canvas)
+            self.center_marker.setColor(QColor(255, 0, 0))
+            self.center_marker.setIconSize(10)
+            self.center_marker.setIconType(QgsVertexMarker.ICON_CROSS)
+            self.center_marker.setPenWidth(2)
+            self.center_marker.hide()
+
+        if self.radius_band is None:
+            self.radius_band = QgsRubberBand(self.canvas, QgsWkbTypes.LineGeometry)
+            self.radius_band.setColor(QColor(255, 0, 0, 200))
+            self.radius_band.setWidth(2)
+
+        if self.sector_band is None:
+            self.sector_band = QgsRubberBand(self.canvas, QgsWkbTypes.PolygonGeometry)
+            self.sector_band.setColor(QColor(0, 100, 255, 50))
+            self.sector_band.setStrokeColor(QColor(0, 100, 255, 200))
+            self.sector_band.setWidth(2)
+
     def show_center_marker(self, point):
         """Show marker at center point."""
-        if self.center_marker:
-            self.canvas.scene().removeItem(self.center_marker)
-
-        self.center_marker = QgsVertexMarker(self.canvas)
+        self._create_visuals()
         self.center_marker.setCenter(point)
-        self.center_marker.setColor(QColor(255, 0, 0))
-        self.center_marker.setIconSize(10)
-        self.center_marker.setIconType(QgsVertexMarker.ICON_CROSS)
-        self.center_marker.setPenWidth(2)
+        self.center_marker.show()
 
     def show_radius_line(self, start, end):
         """Show line indicating radius."""
-        if self.radius_band:
-            self.canvas.scene().removeItem(self.radius_band)
+        self._create_visuals()
+
+        # Cursor still on the center - nothing to draw or transform
+        if start == end:
+            self.radius_band.reset(QgsWkbTypes.LineGeometry)
+            return
 
         # Create line geometry
         line = QgsGeometry.fromPolylineXY([start, end])
 
         # Transform to canvas CRS
-        canvas_crs = self.canvas.mapSettings().destinationCrs()
-        if canvas_crs.authid() != "EPSG:4326":
-            transform = QgsCoordinateTransform(
-                self.wgs84,
-                canvas_crs,
-                QgsProject.instance()
-            )
-            line.transform(transform)
+        if not self._canvas_is_wgs84:
+            line.transform(self._t_from_wgs84)
 
-        self.radius_band = QgsRubberBand(self.canvas, QgsWkbTypes.LineGeometry)
-        self.radius_band.setColor(QColor(255, 0, 0, 200))
-        self.radius_band.setWidth(2)
         self.radius_band.setToGeometry(line, None)
 
+    def _preview_segments(self, radius, arc_length):
+        """
+        Choose a preview segment count from the arc's on-screen length.
+
+        Targets roughly PREVIEW_PX_PER_SEGMENT pixels per edge, so tiny
+        sectors are cheap and large ones stay smooth.
+
+        Args:
+            radius: Radius in meters
+            arc_length: Arc length in degrees
+
+        Returns:
+            int: Number of arc segments
+        """
+        settings = self.canvas.mapSettings()
+        # Ground meters per screen pixel (CRS independent)
+        meters_per_pixel = settings.scale() * 0.0254 / settings.outputDpi()
+        if meters_per_pixel <= 0:
+            return self.PREVIEW_MAX_SEGMENTS
+
+        pixel_arc = radius * math.radians(arc_length) / meters_per_pixel
+        return max(self.PREVIEW_MIN_SEGMENTS,
+                   min(self.PREVIEW_MAX_SEGMENTS, int(pixel_arc / self.PREVIEW_PX_PER_SEGMENT)))
+
     def show_radius_preview(self, center, current):
         """Show preview of radius."""
         self.show_radius_line(center, current)
 
     def show_sector_preview(self, center, radius, start_angle, current_angle):
-        """Show preview of sector."""
-        if self.sector_band:
-            self.canvas.scene().removeItem(self.sector_band)
+        """
+        Show preview of sector.
 
-        # Create sector geometry
-        geometry = self.create_sector_geometry(center, radius, start_angle, current_angle)
+        The arc is walked in fixed steps from the start angle, so while only
+        the end angle moves the existing vertices stay put: the band is
+        updated with a single movePoint of the end vertex, and only rebuilt
+        when the arc gains or loses a whole step.
+        """
+        self._create_visuals()
+
+        if self._arc_params is None:
+            # Step sized to the full circle's on-screen length
+            lat_deg, lon_deg = self._degree_scales(center, radius)
+            step = 360.0 / self._preview_segments(radius, 360.0)
+            self._arc_params = (center.x(), center.y(), lat_deg, lon_deg, step)
+            self._arc_vertices = []
+            self._arc_center = center if self._canvas_is_wgs84 else self._t_from_wgs84.transform(center)
+            self._sector_band_steps = None
+
+        step = self._arc_params[4]
+        arc_length = (current_angle - start_angle) % 360
+        full_steps = int(arc_length / step)
+
+        # Arc vertices up to the last whole step (computed once each)
+        vertices = self._arc_vertices
+        while len(vertices) <= full_steps:
+            vertices.append(self._arc_point(start_angle + len(vertices) * step))
+        end_point = self._arc_point(start_angle + arc_length)
+
+        if full_steps == self._sector_band_steps:
+            # Ring is [center, vertices 0..n, end, center]: move the end vertex
+            self.sector_band.movePoint(full_steps + 2, end_point)
+        else:
+            ring = [self._arc_center] + vertices[:full_steps + 1] + [end_point, self._arc_center]
+            self.sector_band.setToGeometry(QgsGeometry.fromPolygonXY([ring]), None)
+            self._sector_band_steps = full_steps
+
+    def _arc_point(self, angle):
+        """
+        Preview arc vertex at the given bearing, in canvas CRS.
 
-        # Transform to canvas CRS
-        canvas_crs = self.canvas.mapSettings().destinationCrs()
-        if canvas_crs.authid() != "EPSG:4326":
-            transform = QgsCoordinateTransform(
-                self.wgs84,
-                canvas_crs,
-                QgsProject.instance()
-            )
-            geometry.transform(transform)
+        Args:
+            angle: Bearing in degrees (0 = North)
 
-        self.sector_band = QgsRubberBand(self.canvas, QgsWkbTypes.PolygonGeometry)
-        self.sector_band.setColor(QColor(0, 100, 255, 50))
-        self.sector_band.setStrokeColor(QColor(0, 100, 255, 200))
-        self.sector_band.setWidth(2)
-        self.sector_band.setToGeometry(geometry, None)
+        Returns:
+            QgsPointXY in canvas CRS
+        """
+        cx, cy, lat_deg, lon_deg, _ = self._arc_params
+        angle_rad = math.radians(angle)
+        point = QgsPointXY(cx + lon_deg * math.sin(angle_rad), cy + lat_deg * math.cos(angle_rad))
+        return point if self._canvas_is_wgs84 else self._t_from_wgs84.transform(point)
 
     def reset(self):
         """Reset tool to initial state."""
@@ -383,30 +521,68 @@ class SearchSectorTool(QgsMapTool):
         self.radius = None
         self.start_angle = None
         self.end_angle = None
-
-        # Clear visual elements
+        self._move_timer.stop()
+        self._pending_pos = None
+        self._arc_params = None
+        self._arc_vertices = []
+        self._arc_center = None
+        self._sector_band_steps = None
+
+        # Clear visual elements (kept alive for the next sector)
         if self.center_marker:
-            self.canvas.scene().removeItem(self.center_marker)
-            self.center_marker = None
+            self.center_marker.hide()
 
         if self.radius_band:
-            self.canvas.scene().removeItem(self.radius_band)
-            self.radius_band = None
+            self.radius_band.reset(QgsWkbTypes.LineGeometry)
 
         if self.sector_band:
-            self.canvas.scene().removeItem(self.sector_band)
-            self.sector_band = None
+            self.sector_band.reset(QgsWkbTypes.PolygonGeometry)
 
     def activate(self):
         """Called when tool is activated."""
         super().activate()
         self.canvas.setCursor(QCursor(CrossCursor))
         self.reset()
+        self._create_visuals()
+
+        # CRS or transform context may have changed while inactive
+        self._rebuild_transforms()
+        if not self._crs_signal_connected:
+            self.canvas.destinationCrsChanged.connect(self._rebuild_transforms)
+            QgsProject.instance().transformContextChanged.connect(self._rebuild_transforms)
+            self._crs_signal_connected = True
 
     def deactivate(self):
         """Called when tool is deactivated."""
         super().deactivate()
         self.reset()
+        self._release_visuals()
+
+        if self._crs_signal_connected:
+            try:
+                self.canvas.destinationCrsChanged.disconnect(self._rebuild_transforms)
+            except (TypeError, RuntimeError):
+                pass  # Already disconnected or canvas deleted
+            try:
+                QgsProject.instance().transformContextChanged.disconnect(self._rebuild_transforms)
+            except (TypeError, RuntimeError):
+                pass  # Already disconnected
+            self._crs_signal_connected = False
+
+    def _release_visuals(self):
+        """Remove the pooled marker and rubber bands from the canvas scene."""
+        items = (self.center_marker, self.radius_band, self.sector_band)
+        self.center_marker = None
+        self.radius_band = None
+        self.sector_band = None
+        try:
+            scene = self.canvas.scene() if self.canvas else None
+            if scene:
+                for item in items:
+                    if item is not None:
+                        scene.removeItem(item)
+        except RuntimeError:
+            pass  # Already deleted along with the canvas
 
     def isZoomTool(self):
         """Return False - this is not a zoom tool."""
@@ -8,9 +8,16 @@ Ensures only one tool is active at a time.
 Qt5/Qt6 Compatible: Uses qgis.PyQt for all Qt imports.
 """
 
-from qgis.PyQt.QtCore import QObject, pyqtSignal
+import logging
+import sys
+from weakref import WeakValueDictionary
+
+from qgis.PyQt.QtCore import QObject, pyqtSignal, pyqtSlot
 from qgis.gui import QgsMapToolPan
 
+# Set up logger for this module
+logger = logging.getLogger(__name__)
+
 
 class ToolRegistry(QObject):
     """
@@ -26,10 +33,17 @@ class ToolRegistry(QObject):
     Signals:
         tool_activated: Emitted when a tool is activated (tool_name: str)
         tool_deactivated: Emitted when a tool is deactivated (tool_name: str)
+        tool_switched: Emitted instead of tool_deactivated + tool_activated when
+            one tool replaces another (old_name: str, new_name: str)
     """
 
     tool_activated = pyqtSignal(str)  # tool_name
     tool_deactivated = pyqtSignal(str)  # tool_name
+    tool_switched = pyqtSignal(str, str)  # old_name, new_name
+
+    # Fallback pan tools shared by all registries, keyed by id(canvas).
+    # Weak values: a pan tool lives as long as a registry still holds it.
+    _pan_tools = WeakValueDictionary()
 
     def __init__(self, canvas, iface=None):
         """
@@ -43,6 +57,8 @@ class ToolRegistry(QObject):
         self.canvas = canvas
         self.iface = iface
         self.tools = {}  # Dict of {tool_name: tool_instance}
+        self._has_deactivate = {}  # Dict of {tool_name: bool}, resolved at registration
+        self._tool_names = ()  # Snapshot of registered names, refreshed on registration
         self.active_tool_name = None
         self.active_tool = None
         self._pan_tool = None  # Cached pan tool for fallback
@@ -55,8 +71,28 @@ class ToolRegistry(QObject):
             name: Unique tool name (e.g., 'line', 'polygon', 'range_ring')
             tool_instance: Instance of a map tool (QgsMapTool or subclass)
         """
-        self.tools[name] = tool_instance
+        self.register_tools({name: tool_instance})
 
+    def register_tools(self, tools):
+        """
+        Register several drawing tools at once.
+
+        Derived caches are rebuilt once for the whole batch rather than once
+        per tool.
+
+        Args:
+            tools: Dict of {tool_name: tool_instance}, in registration order
+        """
+        for name, tool_instance in tools.items():
+            # Interned so name comparisons short-circuit on identity
+            # (sys.intern only accepts exact str; other keys are stored as-is)
+            if type(name) is str:
+                name = sys.intern(name)
+            self.tools[name] = tool_instance
+            self._has_deactivate[name] = callable(getattr(tool_instance, 'deactivate', None))
+        self._tool_names = tuple(self.tools)
+
+    @pyqtSlot(str, result=bool)
     def activate_tool(self, name):
         """
         Activate a drawing tool by name.
@@ -67,91 +103,94 @@ class ToolRegistry(QObject):
         Returns:
             bool: True if activated successfully, False if tool not found
         """
-        print(f"[REGISTRY] activate_tool('{name}') called")
-        print(f"[REGISTRY] Currently active tool: {self.active_tool_name}")
-        print(f"[REGISTRY] Canvas current tool: {self.canvas.mapTool()}")
-
-        if name not in self.tools:
-            print(f"[REGISTRY] ERROR: Tool '{name}' not registered!")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("activate_tool(%r): active=%s, canvas tool=%s",
+                         name, self.active_tool_name, self.canvas.mapTool())
+
+        if type(name) is str:
+            name = sys.intern(name)
+        tool = self.tools.get(name)  # Single lookup for check and fetch
+        if tool is None:
+            logger.error("Tool '%s' not registered", name)
             return False
 
-        # Deactivate current tool if one is active
+        # Re-requesting the tool that already owns the canvas is a no-op. If
+        # something else took the canvas since, fall through and re-set it.
+        if tool is self.active_tool and self.canvas.mapTool() is tool:
+            return True
+
+        # Deactivate current tool if one is active. When another tool takes
+        # its place, listeners get a single tool_switched instead of a
+        # tool_deactivated/tool_activated pair.
+        switched_from = None
         if self.active_tool:
-            print(f"[REGISTRY] Deactivating current tool '{self.active_tool_name}'...")
             try:
                 # Explicitly deactivate the tool to ensure cleanup
-                if hasattr(self.active_tool, 'deactivate'):
+                if self._has_deactivate[self.active_tool_name]:
                     self.active_tool.deactivate()
                 self.canvas.unsetMapTool(self.active_tool)
                 # Don't set pan tool here - we're about to set a new tool
-                self.tool_deactivated.emit(self.active_tool_name)
-                print(f"[REGISTRY] Previous tool deactivated")
-            except Exception as e:
-                print(f"[REGISTRY] ERROR deactivating tool {self.active_tool_name}: {e}")
-                import traceback
-                traceback.print_exc()
+                if self.active_tool_name != name:
+                    switched_from = self.active_tool_name
+                # (signals are only emitted when something is connected)
+                elif self.receivers(self.tool_deactivated) > 0:
+                    self.tool_deactivated.emit(self.active_tool_name)
+            except Exception:
+                logger.exception("Error deactivating tool %s", self.active_tool_name)
 
         # Activate new tool
-        print(f"[REGISTRY] Activating new tool '{name}'...")
-        self.active_tool = self.tools[name]
+        self.active_tool = tool
         self.active_tool_name = name
         try:
-            print(f"[REGISTRY] Calling canvas.setMapTool()...")
             self.canvas.setMapTool(self.active_tool)
-            print(f"[REGISTRY] canvas.setMapTool() complete")
-            print(f"[REGISTRY] Canvas current tool after set: {self.canvas.mapTool()}")
-            print(f"[REGISTRY] Emitting tool_activated signal...")
-            self.tool_activated.emit(name)
-            print(f"[REGISTRY] Tool '{name}' activated successfully")
+            if switched_from is not None:
+                if self.receivers(self.tool_switched) > 0:
+                    self.tool_switched.emit(switched_from, name)
+            elif self.receivers(self.tool_activated) > 0:
+                self.tool_activated.emit(name)
+            logger.debug("Tool '%s' activated", name)
             return True
-        except Exception as e:
-            print(f"[REGISTRY] ERROR activating tool {name}: {e}")
-            import traceback
-            traceback.print_exc()
+        except Exception:
+            logger.exception("Error activating tool %s", name)
             self.active_tool = None
             self.active_tool_name = None
+            # The previous tool is gone and nothing replaced it
+            if switched_from is not None and self.receivers(self.tool_deactivated) > 0:
+                self.tool_deactivated.emit(switched_from)
             return False
 
+    @pyqtSlot()
     def deactivate_current(self):
         """Deactivate the currently active tool and set default pan tool."""
-        print(f"[REGISTRY] deactivate_current() called")
-        print(f"[REGISTRY] Active tool: {self.active_tool}")
-        print(f"[REGISTRY] Active tool name: {self.active_tool_name}")
-        print(f"[REGISTRY] Canvas current tool: {self.canvas.mapTool()}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("deactivate_current(): active=%s, canvas tool=%s",
+                         self.active_tool_name, self.canvas.mapTool())
 
         if self.active_tool:
             try:
                 # Explicitly deactivate the tool to ensure cleanup
-                if hasattr(self.active_tool, 'deactivate'):
-                    print(f"[REGISTRY] Calling tool.deactivate()...")
+                if self._has_deactivate[self.active_tool_name]:
                     self.active_tool.deactivate()
-                    print(f"[REGISTRY] tool.deactivate() complete")
 
-                print(f"[REGISTRY] Calling canvas.unsetMapTool()...")
                 self.canvas.unsetMapTool(self.active_tool)
-                print(f"[REGISTRY] canvas.unsetMapTool() complete")
-                print(f"[REGISTRY] Canvas current tool after unset: {self.canvas.mapTool()}")
-
-                # CRITICAL: Set pan tool to keep canvas responsive
-                print(f"[REGISTRY] Setting default pan tool...")
-                self._set_default_tool()
-                print(f"[REGISTRY] Canvas tool after setting default: {self.canvas.mapTool()}")
-
-                print(f"[REGISTRY] Emitting tool_deactivated signal...")
-                self.tool_deactivated.emit(self.active_tool_name)
-                print(f"[REGISTRY] Signal emitted")
-            except Exception as e:
-                print(f"[REGISTRY] ERROR deactivating current tool: {e}")
-                import traceback
-                traceback.print_exc()
+
+                # CRITICAL: Set pan tool to keep canvas responsive. One
+                # mapTool() query: if another tool already took over the
+                # canvas (unsetMapTool was a no-op), leave it alone.
+                if self.canvas.mapTool() is None:
+                    self._set_default_tool()
+
+                if self.receivers(self.tool_deactivated) > 0:
+                    self.tool_deactivated.emit(self.active_tool_name)
+            except Exception:
+                logger.exception("Error deactivating current tool")
             finally:
-                print(f"[REGISTRY] Clearing active_tool references...")
                 self.active_tool = None
                 self.active_tool_name = None
-                print(f"[REGISTRY] deactivate_current() complete")
         else:
-            print(f"[REGISTRY] No active tool to deactivate")
+            logger.debug("No active tool to deactivate")
 
+    @pyqtSlot()
     def _set_default_tool(self):
         """
         Set the default pan tool to keep canvas interactive.
@@ -163,15 +202,16 @@ class ToolRegistry(QObject):
             # Option 1: Use iface action if available (preserves toolbar state)
             if self.iface and hasattr(self.iface, 'actionPan'):
                 self.iface.actionPan().trigger()
-                print("[REGISTRY] Set default tool via iface.actionPan()")
             else:
-                # Option 2: Create and set pan tool directly
+                # Option 2: Create (or share) a pan tool and set it directly
                 if not self._pan_tool:
-                    self._pan_tool = QgsMapToolPan(self.canvas)
+                    self._pan_tool = self._pan_tools.get(id(self.canvas))
+                    if self._pan_tool is None:
+                        self._pan_tool = QgsMapToolPan(self.canvas)
+                        self._pan_tools[id(self.canvas)] = self._pan_tool
                 self.canvas.setMapTool(self._pan_tool)
-                print("[REGISTRY] Set default tool via QgsMapToolPan")
         except Exception as e:
-            print(f"[REGISTRY] ERROR setting default tool: {e}")
+            logger.error("Error setting default tool: %s", e)
             # Even if setting pan tool fails, we've at least unset the previous tool
 
     def get_active_tool_name(self):
@@ -193,13 +233,16 @@ class ToolRegistry(QObject):
         Returns:
             bool: True if the specified tool is active
         """
+        # Registered/active names are interned, so == usually resolves on
+        # identity; it still falls back to a value compare for other strings
         return self.active_tool_name == name
 
     def get_registered_tools(self):
         """
-        Get list of all registered tool names.
+        Get all registered tool names.
 
         Returns:
-            list: List of registered tool names
+            tuple: Registered tool names, in registration order (immutable
+                snapshot, rebuilt only when a tool is registered)
         """
-        return list(self.tools.keys())
+        return self._tool_names
@@ -1,6 +1,6 @@
 # -*- coding: utf-8 -*-
 """
-Base Provider ABC
+Base Provider interface
 
 Defines the interface for all data providers (CSV, PostGIS, SpatiaLite)
 """
@@ -8,16 +8,44 @@ Defines the interface for all data providers (CSV, PostGIS, SpatiaLite)
 from abc import ABC, abstractmethod
 from typing import List, Dict, Optional, Any
 
-# Type alias for feature dictionaries
-FeatureDict = Dict[str, Any]
-
-
-class Provider(ABC):
+try:
+    from typing import Protocol, TypedDict, runtime_checkable
+except ImportError:  # Python < 3.8 (older QGIS 3.x builds)
+    Protocol = ABC
+    TypedDict = None
+
+    def runtime_checkable(cls):
+        return cls
+
+# Position record returned by get_current()/get_breadcrumbs(). Providers may
+# omit optional keys, hence total=False.
+if TypedDict is not None:
+    FeatureDict = TypedDict('FeatureDict', {
+        'device_id': str,
+        'name': str,
+        'lat': float,
+        'lon': float,
+        'ts': str,
+        'altitude': Optional[float],
+        'speed': Optional[float],
+        'battery': Optional[float],
+        'motion': bool,
+        'distance': Optional[float],
+        'total_distance': Optional[float],
+    }, total=False)
+else:
+    FeatureDict = Dict[str, Any]
+
+
+@runtime_checkable
+class Provider(Protocol):
     """
-    Abstract base class for data providers.
+    Structural interface for data providers.
 
     All providers must implement these methods to supply tracking data,
-    save features, and manage connections.
+    save features, and manage connections. Protocol's metaclass derives
+    from ABCMeta, so explicit subclasses missing an @abstractmethod still
+    fail to instantiate.
     """
 
     @abstractmethod
@@ -36,7 +64,7 @@ class Provider(ABC):
                 - speed: Optional[float]
                 - battery: Optional[float]
         """
-        pass
+        ...
 
     @abstractmethod
     def get_breadcrumbs(self, since_iso: Optional[str] = None,
@@ -51,7 +79,7 @@ class Provider(ABC):
         Returns:
             List of position dicts (same format as get_current), time-ordered
         """
-        pass
+        ...
 
     @abstractmethod
     def get_devices(self) -> List[Dict[str, Any]]:
@@ -65,7 +93,7 @@ class Provider(ABC):
                 - status: str ('online', 'offline', 'unknown')
                 - last_update: Optional[str] (ISO timestamp)
         """
-        pass
+        ...
 
     @abstractmethod
     def save_casualty(self, mission_id: int, name: str,
@@ -88,7 +116,7 @@ class Provider(ABC):
         Returns:
             ID of saved casualty
         """
-        pass
+        ...
 
     @abstractmethod
     def save_poi(self, mission_id: int, name: str,
@@ -115,7 +143,7 @@ class Provider(ABC):
         Returns:
             ID of saved POI
         """
-        pass
+        ...
 
     @abstractmethod
     def test_connection(self) -> bool:
@@ -125,4 +153,4 @@ class Provider(ABC):
         Returns:
             True if connection successful, False otherwise
         """
-        pass
+        ...
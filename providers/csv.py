@@ -7,12 +7,17 @@ This is a transitional provider for teams currently using CSV workflow.
 """
 
 import os
+import re
 import csv
 import glob
 from typing import List, Dict, Optional, Any, Tuple
 from datetime import datetime
 from .base import Provider, FeatureDict
 
+# One "key=value" token of a Traccar attributes string; the value keeps any
+# further '=' characters, matching a split('=', 1) of the token.
+_ATTR_RE = re.compile(r'([^\s=]*)=(\S*)')
+
 
 class FileCSVProvider(Provider):
     """
@@ -48,25 +53,22 @@ class FileCSVProvider(Provider):
         if not attr_string:
             return attrs
             
-        # Split by double spaces or single spaces
-        parts = attr_string.strip().split()
-        
-        for part in parts:
-            if '=' in part:
-                key, value = part.split('=', 1)
-                # Try to convert to appropriate type
+        for key, value in _ATTR_RE.findall(attr_string):
+            # Convert to appropriate type
+            if '.' in value:
                 try:
-                    if '.' in value:
-                        attrs[key] = float(value)
-                    elif value.lower() == 'true':
-                        attrs[key] = True
-                    elif value.lower() == 'false':
-                        attrs[key] = False
-                    else:
-                        attrs[key] = value
+                    attrs[key] = float(value)
                 except ValueError:
                     attrs[key] = value
-                    
+            else:
+                lowered = value.lower()
+                if lowered == 'true':
+                    attrs[key] = True
+                elif lowered == 'false':
+                    attrs[key] = False
+                else:
+                    attrs[key] = value
+
         return attrs
     
     def _parse_csv_file(self, filepath: str) -> Tuple[str, List[FeatureDict]]:
@@ -80,59 +82,70 @@ class FileCSVProvider(Provider):
         positions = []
         
         with open(filepath, 'r', encoding='utf-8') as f:
-            lines = f.readlines()
-            
-            # Extract device name from header (line 4: "Device:,eoc,,,,,,")
-            for line in lines[:10]:  # Check first 10 lines for device name
-                if line.startswith('Device:'):
+            # Scan the metadata preamble line by line up to the header row
+            # (contains "Valid,Time,Latitude"); the data rows that follow are
+            # streamed straight from the file instead of read into memory.
+            header = None
+            for i, line in enumerate(f):
+                # Extract device name from header (line 4: "Device:,eoc,,,,,,")
+                if i < 10 and line.startswith('Device:'):
                     parts = line.strip().split(',')
                     if len(parts) > 1 and parts[1]:
                         device_name = parts[1]
+                elif 'Valid' in line and 'Time' in line and 'Latitude' in line:
+                    header = next(csv.reader([line]))
                     break
-            
-            # Find the header row (contains "Valid,Time,Latitude")
-            header_idx = -1
-            for i, line in enumerate(lines):
-                if 'Valid' in line and 'Time' in line and 'Latitude' in line:
-                    header_idx = i
-                    break
-            
-            if header_idx == -1:
+
+            if header is None:
                 return device_name, []
-            
-            # Parse CSV data starting after header
-            reader = csv.DictReader(lines[header_idx:])
-            
-            for row in reader:
-                # Skip invalid rows
-                if row.get('Valid', '').strip().upper() not in ('TRUE', '1'):
-                    continue
-                
+
+            # Resolve column positions once; rows are read as plain lists
+            # rather than building a DictReader dict per row.
+            columns = {name: idx for idx, name in enumerate(header)}
+            valid_idx = columns.get('Valid')
+            time_idx = columns.get('Time')
+            lat_idx = columns.get('Latitude')
+            lon_idx = columns.get('Longitude')
+            if None in (valid_idx, time_idx, lat_idx, lon_idx):
+                return device_name, []
+            alt_idx = columns.get('Altitude', len(header))
+            speed_idx = columns.get('Speed', len(header))
+            attr_idx = columns.get('Attributes', len(header))
+
+            for row in csv.reader(f):
                 try:
+                    # Skip invalid rows
+                    if row[valid_idx].strip().upper() not in ('TRUE', '1'):
+                        continue
+
+                    n = len(row)
+                    altitude = row[alt_idx] if alt_idx < n else ''
+                    speed = row[speed_idx] if speed_idx < n else ''
+
                     # Parse attributes
-                    attrs = self._parse_attributes(row.get('Attributes', ''))
-                    
+                    attrs = self._parse_attributes(row[attr_idx] if attr_idx < n else '')
+
                     # Build position dict
                     position = {
                         'device_id': device_name,
                         'name': device_name,
-                        'lat': float(row['Latitude']),
-                        'lon': float(row['Longitude']),
-                        'ts': row['Time'],  # Keep as string (ISO format)
-                        'altitude': float(row['Altitude'].replace(' m', '')) if row.get('Altitude') else None,
-                        'speed': float(row['Speed'].replace(' kn', '')) if row.get('Speed') else None,
+                        'lat': float(row[lat_idx]),
+                        'lon': float(row[lon_idx]),
+                        'ts': row[time_idx],  # Keep as string (ISO format)
+                        'altitude': float(altitude.replace(' m', '')) if altitude else None,
+                        'speed': float(speed.replace(' kn', '')) if speed else None,
                         'battery': attrs.get('batteryLevel'),
                         'motion': attrs.get('motion', True),
                         'distance': attrs.get('distance'),
                         'total_distance': attrs.get('totalDistance')
                     }
-                    
+
                     positions.append(position)
-                    
-                except (ValueError, KeyError) as e:
-                    # Skip malformed rows
+
+                except (ValueError, IndexError):
+                    # Skip malformed or short rows
                     continue
-        
+
         return device_name, positions
     
     def _get_csv_files(self) -> List[str]:
@@ -255,12 +255,15 @@ class sartracker:
         # Initialize Tool Registry
         from .maptools import ToolRegistry
         self.tool_registry = ToolRegistry(self.iface.mapCanvas(), self.iface)
-        self.tool_registry.register_tool('line', self.line_tool)
-        self.tool_registry.register_tool('range_rings', self.range_ring_tool)
-        self.tool_registry.register_tool('bearing', self.bearing_tool)
-        self.tool_registry.register_tool('polygon', self.polygon_tool)
+        self.tool_registry.register_tools({
+            'line': self.line_tool,
+            'range_rings': self.range_ring_tool,
+            'bearing': self.bearing_tool,
+            'polygon': self.polygon_tool,
+        })
         self.tool_registry.tool_activated.connect(self._on_tool_activated)
         self.tool_registry.tool_deactivated.connect(self._on_tool_deactivated)
+        self.tool_registry.tool_switched.connect(self._on_tool_switched)
 
         # Initialize SAR Panel
         self.sar_panel = SARPanel(self.iface.mainWindow())
@@ -417,7 +420,6 @@ class sartracker:
 
         except Exception as e:
             print(f"Error during plugin unload: {e}")
-            import traceback
             traceback.print_exc()
 
 
@@ -976,6 +978,17 @@ class sartracker:
         if hasattr(self, 'sar_panel') and self.sar_panel:
             self.sar_panel.set_active_tool("None")
 
+    def _on_tool_switched(self, old_tool_name, new_tool_name):
+        """
+        Update UI when one drawing tool replaces another.
+
+        Args:
+            old_tool_name: Name of the tool that was deactivated
+            new_tool_name: Name of the newly activated tool
+        """
+        if hasattr(self, 'sar_panel') and self.sar_panel:
+            self.sar_panel.set_active_tool(new_tool_name.title())
+
     def _on_measurement_complete(self, distance_m, distance_km, bearing, point1, point2):
         """
         Handle measurement completion.